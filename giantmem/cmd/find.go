@@ -281,7 +281,7 @@ func expandHitsToMatches(hits []search.Hit, query string, f MatchFilters) ([]mat
 
 	baseArgs := []string{
 		"-n", "-i",
-		"--no-heading", "--no-filename",
+		"--no-heading", "--with-filename", "--null",
 		"--color=never",
 		"--max-columns=4000",
 	}
@@ -310,26 +310,51 @@ func expandHitsToMatches(hits []search.Hit, query string, f MatchFilters) ([]mat
 	return runRgOverHits(rg, phraseArgs, hits, fallback, f), nil
 }
 
-// runRgOverHits executes rg per unique hit filepath. If `primary` returns no
-// rows for a file and `fallback` is non-nil, it retries with `fallback`. For
-// .jsonl session transcripts, each matched line is decoded so the fzf list
-// shows readable text (role + content + tool calls) instead of raw JSON, and
-// the tool names are captured for the --tool filter.
+// runRgOverHits executes rg once over every unique hit filepath. Files that
+// `primary` finds no rows for are retried together with `fallback` when it is
+// non-nil. For .jsonl session transcripts, each matched line is decoded so
+// the fzf list shows readable text (role + content + tool calls) instead of
+// raw JSON, and the tool names are captured for the --tool filter. Rows come
+// back grouped by file in hit order.
 func runRgOverHits(rg string, primary []string, hits []search.Hit, fallback []string, f MatchFilters) []matchRow {
 	wantTools := normalizeToolFilter(f.Tools)
 	wantExts := normalizeExtFilter(f.Exts)
 	includeRead := f.IncludeRead || (wantTools != nil && wantTools["read"])
 
-	collect := func(args []string, h search.Hit) []matchRow {
-		cargs := append(append([]string{}, args...), h.Filepath)
+	var files []search.Hit
+	seen := map[string]bool{}
+	for _, h := range hits {
+		if seen[h.Filepath] {
+			continue
+		}
+		seen[h.Filepath] = true
+		files = append(files, h)
+	}
+
+	// args must carry --with-filename --null so each line is "path\0n:text"
+	collect := func(args []string, batch []search.Hit) map[string][]matchRow {
+		byPath := make(map[string]search.Hit, len(batch))
+		cargs := append(append([]string{}, args...), "--")
+		for _, h := range batch {
+			byPath[h.Filepath] = h
+			cargs = append(cargs, h.Filepath)
+		}
 		out, _ := exec.Command(rg, cargs...).Output()
-		isJSONL := strings.HasSuffix(strings.ToLower(h.Filepath), ".jsonl")
 
-		var rows []matchRow
+		rows := map[string][]matchRow{}
 		sc := bufio.NewScanner(bytes.NewReader(out))
 		sc.Buffer(make([]byte, 0, 1<<20), 16<<20)
 		for sc.Scan() {
 			ln := sc.Text()
+			nul := strings.IndexByte(ln, 0)
+			if nul < 0 {
+				continue
+			}
+			h, ok := byPath[ln[:nul]]
+			if !ok {
+				continue
+			}
+			ln = ln[nul+1:]
 			colon := strings.IndexByte(ln, ':')
 			if colon < 0 {
 				continue
@@ -341,7 +366,7 @@ func runRgOverHits(rg string, primary []string, hits []search.Hit, fallback []st
 			raw := ln[colon+1:]
 
 			row := matchRow{Hit: h, Line: num}
-			if isJSONL {
+			if strings.HasSuffix(strings.ToLower(h.Filepath), ".jsonl") {
 				summary, ok := decodeSessionLine([]byte(raw))
 				if ok {
 					if !includeRead {
@@ -364,23 +389,29 @@ func runRgOverHits(rg string, primary []string, hits []search.Hit, fallback []st
 			} else {
 				row.Display = truncate(strings.TrimSpace(raw), 240)
 			}
-			rows = append(rows, row)
+			rows[h.Filepath] = append(rows[h.Filepath], row)
 		}
 		return rows
 	}
 
-	var rows []matchRow
-	seen := map[string]bool{}
-	for _, h := range hits {
-		if seen[h.Filepath] {
-			continue
+	found := collect(primary, files)
+	if fallback != nil {
+		var missing []search.Hit
+		for _, h := range files {
+			if len(found[h.Filepath]) == 0 {
+				missing = append(missing, h)
+			}
 		}
-		seen[h.Filepath] = true
-		r := collect(primary, h)
-		if len(r) == 0 && fallback != nil {
-			r = collect(fallback, h)
+		if len(missing) > 0 {
+			for p, r := range collect(fallback, missing) {
+				found[p] = r
+			}
 		}
-		rows = append(rows, r...)
+	}
+
+	var rows []matchRow
+	for _, h := range files {
+		rows = append(rows, found[h.Filepath]...)
 	}
 	return rows
 }
@@ -598,10 +629,23 @@ func fzfPickFiles(hits []search.Hit, query string, openEditor bool) error {
 		input.WriteString("\n")
 	}
 
-	preview := "file={1}; " +
+	// the first matching line is looked up lazily, per previewed row, rather
+	// than for every hit before fzf can draw the list
+	var rgPats strings.Builder
+	for _, t := range tokenizeFTSQuery(query) {
+		rgPats.WriteString(" -e ")
+		rgPats.WriteString(shellQuote(t))
+	}
+	preview := "file={1}; line=1; "
+	if rgPats.Len() > 0 {
+		preview += "if command -v rg >/dev/null 2>&1; then " +
+			"n=$(rg -n -i -F --max-count=1 --no-filename" + rgPats.String() + " -- \"$file\" 2>/dev/null | head -1 | cut -d: -f1); " +
+			"[ -n \"$n\" ] && line=$n; fi; "
+	}
+	preview += "start=$(( line > 20 ? line - 20 : 1 )); " +
 		"if command -v bat >/dev/null 2>&1; then " +
-		"bat --color=always --style=numbers --line-range=:200 \"$file\" 2>/dev/null; " +
-		"else sed -n '1,120p' \"$file\"; fi"
+		"bat --color=always --style=numbers --highlight-line=\"$line\" --line-range=\"$start:$((start + 200))\" \"$file\" 2>/dev/null; " +
+		"else sed -n \"${start},$((start + 120))p\" \"$file\"; fi"
 
 	cmd := exec.Command(fzf,
 		"--ansi",
@@ -39,12 +39,6 @@ search; the daemon does not depend on them.
 --sessions-only / --workspaces-only translate to source filters.`,
 	RunE: func(cmd *cobra.Command, args []string) error {
 		home, _ := os.UserHomeDir()
-		d, err := db.Open(archiveDBPath())
-		if err != nil {
-			return err
-		}
-		defer d.Close()
-
 		cfg, err := sources.LoadConfig(sources.DefaultConfigPath())
 		if err != nil {
 			return err
@@ -62,6 +56,17 @@ search; the daemon does not depend on them.
 			filter = append(filter, "workspace-md", "domain-json")
 		}
 
+		// rebuild non-session scope when running workspace builtins fresh:
+		// matches legacy behavior of dropping then re-inserting.
+		runners := reg.Filter(filter)
+		rebuild := shouldDropWorkspace(runners)
+
+		d, err := db.OpenBulk(archiveDBPath())
+		if err != nil {
+			return err
+		}
+		defer d.Close()
+
 		opts := sources.EmitOptions{
 			ArchiveBase:    archiveBasePath(),
 			ClaudeProjects: filepath.Join(home, ".claude", "projects"),
@@ -70,13 +75,25 @@ search; the daemon does not depend on them.
 			DB:             d,
 		}
 
-		// rebuild non-session scope when running workspace builtins fresh:
-		// matches legacy behavior of dropping then re-inserting.
-		runners := reg.Filter(filter)
-		if shouldDropWorkspace(runners) {
+		automergeOff := false
+		if rebuild {
 			if err := dropNonSessionRows(d, ingestProject); err != nil {
 				return err
 			}
+			// defer segment merges until every doc is in, then merge once.
+			// the level persists in the fts config table, so error paths
+			// restore it too; a run killed outright is healed by the next.
+			if err := setFTSAutomerge(d, 0); err != nil {
+				return err
+			}
+			automergeOff = true
+			defer func() {
+				if automergeOff {
+					setFTSAutomerge(d, ftsDefaultAutomerge)
+				}
+			}()
+		} else {
+			restoreFTSAutomerge(d)
 		}
 		ctx := context.Background()
 		perSource := map[string]sources.Stats{}
@@ -87,8 +104,35 @@ search; the daemon does not depend on them.
 			}
 			perSource[src.Name()] = st
 		}
-
 		printIngestStats(perSource)
+
+		// every doc is committed by now; maintenance that loses a lock race
+		// (SQLITE_BUSY from a reader or the session hook) is retried by the
+		// next run, so warn instead of failing the sweep.
+		if rebuild {
+			// restore before the merge and checkpoint so the config write
+			// doesn't land in the wal after it's truncated
+			if err := setFTSAutomerge(d, ftsDefaultAutomerge); err != nil {
+				fmt.Fprintf(os.Stderr, "warn: fts automerge: %v\n", err)
+			} else {
+				automergeOff = false
+			}
+			// --force over every source re-inserted every row, so the whole
+			// index is worth rewriting; anything narrower gets a bounded merge
+			full := ingestForce && ingestProject == "" && len(filter) == 0
+			if err := mergeFTS(d, full); err != nil {
+				fmt.Fprintf(os.Stderr, "warn: fts merge: %v\n", err)
+			}
+		}
+		if err := db.Optimize(d); err != nil {
+			fmt.Fprintf(os.Stderr, "warn: optimize: %v\n", err)
+		}
+		frames, err := db.CheckpointTruncate(d)
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "warn: wal checkpoint: %v\n", err)
+		} else if frames > 0 {
+			fmt.Printf("checkpointed %d wal frames\n", frames)
+		}
 		return nil
 	},
 }
@@ -114,37 +158,59 @@ func dropNonSessionRows(d *sql.DB, project string) error {
 	} else {
 		cond = "source_type != 'session'"
 	}
-	rows, err := d.Query("SELECT id FROM documents WHERE "+cond, args...)
+	tx, err := d.Begin()
 	if err != nil {
 		return err
 	}
-	var ids []int64
-	for rows.Next() {
-		var id int64
-		if err := rows.Scan(&id); err != nil {
-			rows.Close()
-			return err
-		}
-		ids = append(ids, id)
-	}
-	rows.Close()
-	tx, err := d.Begin()
-	if err != nil {
+	if _, err := tx.Exec("DELETE FROM documents_fts WHERE rowid IN (SELECT id FROM documents WHERE "+cond+")", args...); err != nil {
+		tx.Rollback()
 		return err
 	}
-	for _, id := range ids {
-		if _, err := tx.Exec("DELETE FROM documents_fts WHERE rowid = ?", id); err != nil {
-			tx.Rollback()
-			return err
-		}
-		if _, err := tx.Exec("DELETE FROM documents WHERE id = ?", id); err != nil {
-			tx.Rollback()
-			return err
-		}
+	if _, err := tx.Exec("DELETE FROM documents WHERE "+cond, args...); err != nil {
+		tx.Rollback()
+		return err
 	}
 	return tx.Commit()
 }
 
+// ftsDefaultAutomerge is fts5's built-in automerge level.
+const ftsDefaultAutomerge = 4
+
+// ftsMergePages bounds the merge after a partial rebuild: roughly the
+// number of leaf pages one 'merge' command may write.
+const ftsMergePages = 2000
+
+// setFTSAutomerge sets documents_fts's automerge level. The value persists in
+// the fts config table, so callers that disable it must restore it.
+func setFTSAutomerge(d *sql.DB, n int) error {
+	_, err := d.Exec("INSERT INTO documents_fts(documents_fts, rank) VALUES('automerge', ?)", n)
+	return err
+}
+
+// restoreFTSAutomerge re-enables automerge if a rebuild died with it still
+// disabled. Best-effort: a failure here only leaves merges deferred.
+func restoreFTSAutomerge(d *sql.DB) {
+	var v int
+	err := d.QueryRow("SELECT v FROM documents_fts_config WHERE k = 'automerge'").Scan(&v)
+	if err == nil && v == 0 {
+		setFTSAutomerge(d, ftsDefaultAutomerge)
+	}
+}
+
+// mergeFTS merges the documents_fts segments left by a bulk rebuild, in place
+// of the incremental merges skipped while loading. Only a full rebuild
+// rewrites the whole index into one b-tree; any other rebuild touched a slice
+// of it (the session rows, most of the index, weren't rewritten), so it runs
+// a bounded merge instead.
+func mergeFTS(d *sql.DB, full bool) error {
+	if full {
+		_, err := d.Exec("INSERT INTO documents_fts(documents_fts) VALUES('optimize')")
+		return err
+	}
+	_, err := d.Exec("INSERT INTO documents_fts(documents_fts, rank) VALUES('merge', ?)", ftsMergePages)
+	return err
+}
+
 func printIngestStats(perSource map[string]sources.Stats) {
 	var names []string
 	for n := range perSource {
@@ -15,6 +15,11 @@ type Classification struct {
 	Name    string
 }
 
+// SessionsIndexRel is the session end hook's json index of history/sessions/,
+// relative to .giantmem/. A machine index, not a doc: neither Classify nor the
+// live_docs backfill picks it up.
+const SessionsIndexRel = "history/sessions.jsonl"
+
 // Classify infers an artifact's identity from its workspace-relative path.
 // Returns ok=false when the path does not match any known artifact location.
 //
@@ -40,6 +45,9 @@ func Classify(rel string) (Classification, bool) {
 	case "artifacts.json", "features.json", "meta.json", "_index.md", "_history.md":
 		return Classification{}, false
 	}
+	if rel == SessionsIndexRel {
+		return Classification{}, false
+	}
 
 	// .giantmem/specs/{domain}/spec.md  -> source-spec
 	if len(parts) >= 3 && parts[0] == "specs" && last == "spec.md" {
@@ -28,6 +28,7 @@ func TestClassify(t *testing.T) {
 		{"specs/_history.md", "", "", "", false},
 		{".mdlive/tabs.json", "", "", "", false},
 		{".mdlive/history/features/foo/x.md", "", "", "", false},
+		{"history/sessions.jsonl", "", "", "", false},
 		// everything real carries a type
 		{"WORKSPACE.md", "workspace", "", "", true},
 		{"notes.md", "notes", "", "notes", true},
@@ -89,6 +89,9 @@ func walkWorkspace(db *sql.DB, archiveBase, ws string, st *Stats) {
 		if name == ".giantmem-index" || name == ".DS_Store" || strings.HasPrefix(name, ".") {
 			return nil
 		}
+		if rel, rerr := filepath.Rel(ws, p); rerr == nil && filepath.ToSlash(rel) == artifacts.SessionsIndexRel {
+			return nil
+		}
 		feature := featureFromPath(p)
 		if feature == "" {
 			feature = featureFromJSON
@@ -67,6 +67,29 @@ func TestRunOnWorkspace_IndexesAllNonEmptyFiles(t *testing.T) {
 	}
 }
 
+func TestRunOnWorkspace_SkipsSessionsIndex(t *testing.T) {
+	live, base := newLive(t)
+	repo := filepath.Join(t.TempDir(), "repo3")
+	ws := filepath.Join(repo, ".giantmem")
+	writeFile(t, filepath.Join(ws, "history", "sessions.md"), "- session one")
+	writeFile(t, filepath.Join(ws, "history", "sessions.jsonl"), `{"file":"x.md"}`+"\n")
+
+	st, err := RunOnWorkspace(live, base, ws)
+	if err != nil {
+		t.Fatalf("run: %v", err)
+	}
+	if st.Upserted != 1 {
+		t.Errorf("upserted = %d, want 1 (sessions.md only); stats=%+v", st.Upserted, st)
+	}
+	var n int
+	if err := live.QueryRow("SELECT COUNT(*) FROM live_docs WHERE path LIKE '%sessions.jsonl'").Scan(&n); err != nil {
+		t.Fatalf("count: %v", err)
+	}
+	if n != 0 {
+		t.Errorf("sessions.jsonl rows = %d, want 0", n)
+	}
+}
+
 func TestRunOnWorkspace_Idempotent(t *testing.T) {
 	live, base := newLive(t)
 	repo := filepath.Join(t.TempDir(), "repo2")
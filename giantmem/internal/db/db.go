@@ -14,10 +14,64 @@ import (
 // Open opens the named SQLite db with WAL + busy timeout, then runs any pending
 // migrations to bring it up to head. If the file is missing, it's created.
 func Open(path string) (*sql.DB, error) {
+	return open(path, "")
+}
+
+// bulkPragmas trade memory for write throughput: large page cache,
+// in-memory temp store, mmap reads. locking_mode=EXCLUSIVE is deliberately
+// left out: the mcp server and gui read archives.db while the session sweep
+// ingests.
+//
+// synchronous stays NORMAL: in WAL mode that already skips the fsync on each
+// commit and is crash-safe. OFF would let a power loss tear the db file, and
+// archives.db holds session rows that can't be rebuilt once their
+// transcripts are pruned from disk.
+const bulkPragmas = "&_pragma=synchronous(NORMAL)" +
+	"&_pragma=cache_size(-262144)" +
+	"&_pragma=temp_store(MEMORY)" +
+	"&_pragma=mmap_size(268435456)"
+
+// OpenBulk is Open tuned for ingest. Callers should run Optimize before
+// closing so the planner stats reflect the new rows.
+func OpenBulk(path string) (*sql.DB, error) {
+	return open(path, bulkPragmas)
+}
+
+// Optimize runs PRAGMA optimize. Cheap when nothing changed.
+func Optimize(d *sql.DB) error {
+	_, err := d.Exec("PRAGMA optimize")
+	return err
+}
+
+// CheckpointTruncate copies the WAL back into the db and truncates the -wal
+// file to zero bytes. Passive auto-checkpoints never shrink the file, so
+// after a bulk ingest it would otherwise stay at its high-water mark.
+// Returns the number of frames checkpointed, and an error if a reader kept
+// the truncate from completing.
+func CheckpointTruncate(d *sql.DB) (int, error) {
+	// TRUNCATE reports 0/0 once the log is reset, so take the frame count
+	// from a passive pass first; the truncate then has nothing left to copy.
+	var busy, logFrames, checkpointed int
+	if err := d.QueryRow("PRAGMA wal_checkpoint(PASSIVE)").Scan(&busy, &logFrames, &checkpointed); err != nil {
+		return 0, err
+	}
+	// a reader (daemon, search) holding the wal makes the truncate give up
+	// with busy=1 rather than an error
+	var tBusy, tLog, tCheckpointed int
+	if err := d.QueryRow("PRAGMA wal_checkpoint(TRUNCATE)").Scan(&tBusy, &tLog, &tCheckpointed); err != nil {
+		return checkpointed, err
+	}
+	if tBusy != 0 || tLog != tCheckpointed {
+		return checkpointed, fmt.Errorf("wal not truncated: busy (%d of %d frames checkpointed)", tCheckpointed, tLog)
+	}
+	return checkpointed, nil
+}
+
+func open(path, extra string) (*sql.DB, error) {
 	if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
 		return nil, err
 	}
-	d, err := sql.Open("sqlite", path+"?_pragma=journal_mode(WAL)&_pragma=busy_timeout(5000)")
+	d, err := sql.Open("sqlite", path+"?_pragma=journal_mode(WAL)&_pragma=busy_timeout(5000)"+extra)
 	if err != nil {
 		return nil, err
 	}
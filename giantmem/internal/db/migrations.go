@@ -90,6 +90,21 @@ var archiveMigrations = []Migration{
 			return err
 		},
 	},
+	{
+		Version: 5,
+		Name:    "add mtime_ns column",
+		Apply: func(tx *sql.Tx) error {
+			cols, err := txTableColumns(tx, "documents")
+			if err != nil {
+				return err
+			}
+			if _, has := cols["mtime_ns"]; has {
+				return nil
+			}
+			_, err = tx.Exec(`ALTER TABLE documents ADD COLUMN mtime_ns INTEGER`)
+			return err
+		},
+	},
 }
 
 // liveMigrations is the canonical list for live.db.
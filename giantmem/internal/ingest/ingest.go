@@ -131,33 +131,17 @@ func Run(db *sql.DB, opt Options) (Stats, error) {
 		} else {
 			deleteCond = "source_type != 'session'"
 		}
-		idRows, err := db.Query("SELECT id FROM documents WHERE "+deleteCond, deleteArgs...)
+		tx, err := db.Begin()
 		if err != nil {
 			return st, err
 		}
-		var oldIDs []int64
-		for idRows.Next() {
-			var id int64
-			if err := idRows.Scan(&id); err != nil {
-				idRows.Close()
-				return st, err
-			}
-			oldIDs = append(oldIDs, id)
-		}
-		idRows.Close()
-		tx, err := db.Begin()
-		if err != nil {
+		if _, err := tx.Exec("DELETE FROM documents_fts WHERE rowid IN (SELECT id FROM documents WHERE "+deleteCond+")", deleteArgs...); err != nil {
+			tx.Rollback()
 			return st, err
 		}
-		for _, id := range oldIDs {
-			if _, err := tx.Exec("DELETE FROM documents_fts WHERE rowid = ?", id); err != nil {
-				tx.Rollback()
-				return st, err
-			}
-			if _, err := tx.Exec("DELETE FROM documents WHERE id = ?", id); err != nil {
-				tx.Rollback()
-				return st, err
-			}
+		if _, err := tx.Exec("DELETE FROM documents WHERE "+deleteCond, deleteArgs...); err != nil {
+			tx.Rollback()
+			return st, err
 		}
 		if err := tx.Commit(); err != nil {
 			return st, err
@@ -288,28 +272,32 @@ func ResolveLatestTimestamps(archiveBase string) map[string]bool {
 	return resolveLatestTimestamps(archiveBase)
 }
 
+// resolveLatestTimestamps only looks one level down: the archiver writes
+// "latest" as {archiveBase}/{project}/latest, so walking the whole archive
+// to find them re-enumerates every snapshot file for nothing.
 func resolveLatestTimestamps(archiveBase string) map[string]bool {
 	out := map[string]bool{}
-	filepath.WalkDir(archiveBase, func(p string, d fs.DirEntry, err error) error {
+	entries, err := os.ReadDir(archiveBase)
+	if err != nil {
+		return out
+	}
+	for _, e := range entries {
+		if !e.IsDir() {
+			continue
+		}
+		p := filepath.Join(archiveBase, e.Name(), "latest")
+		info, err := os.Lstat(p)
+		if err != nil || info.Mode()&os.ModeSymlink == 0 {
+			continue
+		}
+		resolved, err := filepath.EvalSymlinks(p)
 		if err != nil {
-			return nil
+			continue
 		}
-		if d.Name() == "latest" {
-			info, err := os.Lstat(p)
-			if err != nil {
-				return nil
-			}
-			if info.Mode()&os.ModeSymlink != 0 {
-				resolved, err := filepath.EvalSymlinks(p)
-				if err == nil {
-					if st, err := os.Stat(resolved); err == nil && st.IsDir() {
-						out[resolved] = true
-					}
-				}
-			}
+		if st, err := os.Stat(resolved); err == nil && st.IsDir() {
+			out[resolved] = true
 		}
-		return nil
-	})
+	}
 	return out
 }
 
@@ -0,0 +1,42 @@
+package ingest
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+func TestResolveLatestTimestamps(t *testing.T) {
+	base := t.TempDir()
+	for _, dir := range []string{
+		"proj-a/20240101_120000/plans",
+		"proj-a/20240202_120000",
+		"proj-b/20240303_120000",
+		"proj-c/20240404_120000/nested",
+	} {
+		if err := os.MkdirAll(filepath.Join(base, dir), 0o755); err != nil {
+			t.Fatalf("mkdir: %v", err)
+		}
+	}
+	// proj-a: relative link like the archiver writes
+	if err := os.Symlink("20240202_120000", filepath.Join(base, "proj-a", "latest")); err != nil {
+		t.Fatalf("symlink: %v", err)
+	}
+	// proj-b: dangling link is ignored
+	if err := os.Symlink("missing", filepath.Join(base, "proj-b", "latest")); err != nil {
+		t.Fatalf("symlink: %v", err)
+	}
+	// proj-c: plain dir named latest is not a link and is ignored
+	if err := os.MkdirAll(filepath.Join(base, "proj-c", "latest"), 0o755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+
+	got := ResolveLatestTimestamps(base)
+	want, err := filepath.EvalSymlinks(filepath.Join(base, "proj-a", "20240202_120000"))
+	if err != nil {
+		t.Fatalf("eval: %v", err)
+	}
+	if len(got) != 1 || !got[want] {
+		t.Fatalf("ResolveLatestTimestamps = %v, want only %q", got, want)
+	}
+}
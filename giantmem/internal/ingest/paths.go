@@ -8,6 +8,20 @@ import (
 
 var TimestampRe = regexp.MustCompile(`^\d{8}_\d{6}$`)
 
+// isTimestamp is TimestampRe.MatchString without the regexp machinery; it
+// runs once per file on every ingest walk.
+func isTimestamp(s string) bool {
+	if len(s) != 15 || s[8] != '_' {
+		return false
+	}
+	for i := 0; i < 15; i++ {
+		if i != 8 && (s[i] < '0' || s[i] > '9') {
+			return false
+		}
+	}
+	return true
+}
+
 var validDirTypes = map[string]bool{
 	"plans":    true,
 	"context":  true,
@@ -34,11 +48,12 @@ func ParseArchivePath(absPath, archiveBase string) (*ParsedPath, bool) {
 	if err != nil {
 		return nil, false
 	}
-	parts := strings.Split(rel, string(filepath.Separator))
+	// only project/timestamp/dir_type matter; don't split the rest
+	parts := strings.SplitN(rel, string(filepath.Separator), 4)
 	if len(parts) < 3 {
 		return nil, false
 	}
-	if !TimestampRe.MatchString(parts[1]) {
+	if !isTimestamp(parts[1]) {
 		return nil, false
 	}
 	p := &ParsedPath{
@@ -0,0 +1,44 @@
+package ingest
+
+import (
+	"path/filepath"
+	"testing"
+)
+
+func TestIsTimestampMatchesRegexp(t *testing.T) {
+	for _, s := range []string{
+		"20240101_120000", "00000000_000000", "2024010_1120000", "20240101-120000",
+		"20240101_12000", "20240101_1200000", "2024O101_120000", "20240101_12000a",
+		"", "latest", "٢٠٢٤٠١٠١_١٢٠٠٠٠",
+	} {
+		if got, want := isTimestamp(s), TimestampRe.MatchString(s); got != want {
+			t.Errorf("isTimestamp(%q) = %v, TimestampRe says %v", s, got, want)
+		}
+	}
+}
+
+func TestParseArchivePath(t *testing.T) {
+	base := "/archive"
+	cases := []struct {
+		path string
+		want *ParsedPath
+	}{
+		{"/archive/proj/20240101_120000/plans/a/b.md", &ParsedPath{"proj", "20240101_120000", "plans"}},
+		{"/archive/proj/20240101_120000/notes.md", &ParsedPath{"proj", "20240101_120000", "root"}},
+		{"/archive/proj/20240101_120000/other/x.md", &ParsedPath{"proj", "20240101_120000", "root"}},
+		{"/archive/proj/latest/plans/x.md", nil},
+		{"/archive/proj/x.md", nil},
+	}
+	for _, c := range cases {
+		got, ok := ParseArchivePath(filepath.FromSlash(c.path), base)
+		if c.want == nil {
+			if ok {
+				t.Errorf("ParseArchivePath(%q) = %+v, want no match", c.path, got)
+			}
+			continue
+		}
+		if !ok || *got != *c.want {
+			t.Errorf("ParseArchivePath(%q) = %+v, %v; want %+v", c.path, got, ok, c.want)
+		}
+	}
+}
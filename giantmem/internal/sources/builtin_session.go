@@ -39,16 +39,15 @@ func (s *claudeJSONLSource) Emit(ctx context.Context, opts EmitOptions) (<-chan
 		}
 
 		// build mtime cache for incremental skip
-		existing := map[string]time.Time{}
+		existing := map[string]indexedFile{}
 		if !opts.Force && opts.DB != nil {
-			rows, err := opts.DB.Query("SELECT filepath, indexed_at FROM documents WHERE source_type = 'session'")
+			rows, err := opts.DB.Query("SELECT filepath, COALESCE(mtime_ns, 0), indexed_at FROM documents WHERE source_type = 'session'")
 			if err == nil {
 				for rows.Next() {
 					var fp, ia string
-					if err := rows.Scan(&fp, &ia); err == nil {
-						if t, err := time.Parse(time.RFC3339, ia); err == nil {
-							existing[fp] = t
-						}
+					var ns int64
+					if err := rows.Scan(&fp, &ns, &ia); err == nil {
+						existing[fp] = indexedFile{mtimeNs: ns, indexedAt: parseIndexedAt(ia)}
 					}
 				}
 				rows.Close()
@@ -74,7 +73,7 @@ func (s *claudeJSONLSource) Emit(ctx context.Context, opts EmitOptions) (<-chan
 				return nil
 			}
 			if !opts.Force {
-				if t, ok := existing[p]; ok && !mtime.After(t) {
+				if prev, ok := existing[p]; ok && prev.unchanged(mtime) {
 					return nil
 				}
 			}
@@ -96,6 +95,7 @@ func (s *claudeJSONLSource) Emit(ctx context.Context, opts EmitOptions) (<-chan
 				Topic:      topic,
 				Cwd:        extract.Cwd,
 				Content:    extract.Text,
+				MtimeNs:    mtime.UnixNano(),
 			}
 			select {
 			case docCh <- doc:
@@ -107,3 +107,31 @@ func (s *claudeJSONLSource) Emit(ctx context.Context, opts EmitOptions) (<-chan
 	}()
 	return docCh, errCh
 }
+
+// indexedFile is what the incremental skip knows about an already-indexed
+// transcript.
+type indexedFile struct {
+	mtimeNs   int64
+	indexedAt time.Time
+}
+
+// unchanged reports whether the file at mtime matches what was indexed.
+// Rows written before mtime_ns existed fall back to indexed_at.
+func (f indexedFile) unchanged(mtime time.Time) bool {
+	if f.mtimeNs != 0 {
+		return f.mtimeNs == mtime.UnixNano()
+	}
+	return !f.indexedAt.IsZero() && !mtime.After(f.indexedAt)
+}
+
+// parseIndexedAt accepts both indexed_at formats in archives.db: RFC3339 from
+// the old ingest pass and sqlite's datetime('now') (UTC) from Upsert.
+func parseIndexedAt(s string) time.Time {
+	if t, err := time.Parse(time.RFC3339, s); err == nil {
+		return t
+	}
+	if t, err := time.Parse(time.DateTime, s); err == nil {
+		return t
+	}
+	return time.Time{}
+}
@@ -0,0 +1,38 @@
+package sources
+
+import (
+	"testing"
+	"time"
+)
+
+func TestParseIndexedAt(t *testing.T) {
+	want := time.Date(2025, 3, 4, 5, 6, 7, 0, time.UTC)
+	for _, in := range []string{"2025-03-04T05:06:07Z", "2025-03-04 05:06:07"} {
+		if got := parseIndexedAt(in); !got.Equal(want) {
+			t.Errorf("parseIndexedAt(%q) = %v, want %v", in, got, want)
+		}
+	}
+	if got := parseIndexedAt("garbage"); !got.IsZero() {
+		t.Errorf("parseIndexedAt(garbage) = %v, want zero", got)
+	}
+}
+
+func TestIndexedFileUnchanged(t *testing.T) {
+	mtime := time.Date(2025, 3, 4, 5, 6, 7, 123, time.UTC)
+	cases := []struct {
+		name string
+		f    indexedFile
+		want bool
+	}{
+		{"same mtime_ns", indexedFile{mtimeNs: mtime.UnixNano()}, true},
+		{"different mtime_ns", indexedFile{mtimeNs: mtime.UnixNano() - 1}, false},
+		{"legacy row indexed after write", indexedFile{indexedAt: mtime.Add(time.Minute)}, true},
+		{"legacy row indexed before write", indexedFile{indexedAt: mtime.Add(-time.Minute)}, false},
+		{"legacy row unparseable indexed_at", indexedFile{}, false},
+	}
+	for _, c := range cases {
+		if got := c.f.unchanged(mtime); got != c.want {
+			t.Errorf("%s: unchanged = %v, want %v", c.name, got, c.want)
+		}
+	}
+}
@@ -5,6 +5,7 @@ import (
 	"io/fs"
 	"path/filepath"
 	"strings"
+	"sync"
 
 	"github.com/bearded-giant/giant-tooling/giantmem/internal/ingest"
 )
@@ -15,6 +16,8 @@ func init() {
 	})
 }
 
+var fileboxSeg = string(filepath.Separator) + "filebox" + string(filepath.Separator)
+
 // workspaceMDSource walks ~/giantmem_archive/{project}/{ts}/ for .md files
 // and any non-md filebox/* contents. Mirrors the original ingestWorkspaces
 // .md and filebox passes.
@@ -29,10 +32,33 @@ func (s *workspaceMDSource) Enabled() bool { return s.cfg.Enabled }
 func (s *workspaceMDSource) Emit(ctx context.Context, opts EmitOptions) (<-chan Doc, <-chan error) {
 	docCh := make(chan Doc, 32)
 	errCh := make(chan error, 4)
+	// walker -> readers -> docCh. file reads block on disk, so overlap them
+	// with each other and with the single sqlite writer draining docCh.
+	pending := make(chan Doc, 64)
 
+	var wg sync.WaitGroup
+	for i := 0; i < readWorkers(); i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for doc := range pending {
+				doc.Content = readFile(doc.Filepath)
+				select {
+				case docCh <- doc:
+				case <-ctx.Done():
+					return
+				}
+			}
+		}()
+	}
 	go func() {
-		defer close(docCh)
-		defer close(errCh)
+		wg.Wait()
+		close(docCh)
+		close(errCh)
+	}()
+
+	go func() {
+		defer close(pending)
 		scanRoot := opts.ArchiveBase
 		if opts.Project != "" {
 			scanRoot = filepath.Join(opts.ArchiveBase, opts.Project)
@@ -49,21 +75,24 @@ func (s *workspaceMDSource) Emit(ctx context.Context, opts EmitOptions) (<-chan
 				}
 				return nil
 			}
-			if d.Name() == ".giantmem-index" || d.Name() == ".DS_Store" {
+			name := d.Name()
+			if name == ".giantmem-index" || name == ".DS_Store" {
 				return nil
 			}
+			// name checks first: ParseArchivePath allocates per call
+			isMD := strings.HasSuffix(name, ".md")
+			if !isMD {
+				if strings.HasPrefix(name, ".") {
+					return nil
+				}
+				if !strings.Contains(p, fileboxSeg) {
+					return nil
+				}
+			}
 			parsed, ok := ingest.ParseArchivePath(p, opts.ArchiveBase)
 			if !ok {
 				return nil
 			}
-			isMD := strings.HasSuffix(p, ".md")
-			isFilebox := strings.Contains(p, string(filepath.Separator)+"filebox"+string(filepath.Separator))
-			if !isMD && !isFilebox {
-				return nil
-			}
-			if !isMD && strings.HasPrefix(d.Name(), ".") {
-				return nil
-			}
 			ts := filepath.Join(opts.ArchiveBase, parsed.Project, parsed.Timestamp)
 			doc := Doc{
 				Filepath:   p,
@@ -72,10 +101,9 @@ func (s *workspaceMDSource) Emit(ctx context.Context, opts EmitOptions) (<-chan
 				Timestamp:  parsed.Timestamp,
 				DirType:    parsed.DirType,
 				IsLatest:   latest[ts],
-				Content:    readFile(p),
 			}
 			select {
-			case docCh <- doc:
+			case pending <- doc:
 			case <-ctx.Done():
 				return fs.SkipAll
 			}
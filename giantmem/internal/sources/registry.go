@@ -5,6 +5,7 @@ import (
 	"database/sql"
 	"fmt"
 	"path/filepath"
+	"time"
 
 	"github.com/bearded-giant/giant-tooling/giantmem/internal/project"
 )
@@ -63,11 +64,137 @@ func (r *Registry) Filter(names []string) []Source {
 	return out
 }
 
+// Run commits its batch tx at upsertBatch docs, upsertBatchBytes of
+// content, or upsertFlushEvery, whichever comes first. Committing per row
+// makes every doc its own fsync; one giant tx holds the write lock for the
+// whole run and blocks the session hook's writer. The time and byte bounds
+// keep slow or large docs from holding the lock past the hook's 5s
+// busy_timeout.
+const (
+	upsertBatch      = 1000
+	upsertBatchBytes = 8 << 20
+	upsertFlushEvery = 250 * time.Millisecond
+)
+
+// upsert statements, prepared once per Run by prepareUpsert.
+const (
+	selectDocIDSQL = "SELECT id FROM documents WHERE filepath = ?"
+	deleteFTSSQL   = "DELETE FROM documents_fts WHERE rowid = ?"
+	deleteDocSQL   = "DELETE FROM documents WHERE id = ?"
+	insertDocSQL   = `INSERT INTO documents
+            (project, timestamp, source_type, dir_type, filepath, filename,
+             is_latest, session_id, topic, indexed_at, cwd, canonical_project, mtime_ns)
+         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), ?, ?, ?)`
+	insertFTSSQL = "INSERT INTO documents_fts (rowid, content) VALUES (?, ?)"
+
+	// each doc's writes run inside a savepoint so a failed insert rolls back
+	// its deletes without aborting the rest of the batch
+	savepointSQL  = "SAVEPOINT upsert_doc"
+	releaseSQL    = "RELEASE upsert_doc"
+	rollbackToSQL = "ROLLBACK TO upsert_doc"
+)
+
+// upsertStmts holds the statements upsert runs for each doc. Run prepares
+// them once and binds them to every batch transaction with in, so no SQL is
+// re-parsed per doc.
+type upsertStmts struct {
+	selectDocID *sql.Stmt
+	deleteFTS   *sql.Stmt
+	deleteDoc   *sql.Stmt
+	insertDoc   *sql.Stmt
+	insertFTS   *sql.Stmt
+	savepoint   *sql.Stmt
+	release     *sql.Stmt
+	rollbackTo  *sql.Stmt
+}
+
+func prepareUpsert(db *sql.DB) (*upsertStmts, error) {
+	s := &upsertStmts{}
+	for _, p := range []struct {
+		dst   **sql.Stmt
+		query string
+	}{
+		{&s.selectDocID, selectDocIDSQL},
+		{&s.deleteFTS, deleteFTSSQL},
+		{&s.deleteDoc, deleteDocSQL},
+		{&s.insertDoc, insertDocSQL},
+		{&s.insertFTS, insertFTSSQL},
+		{&s.savepoint, savepointSQL},
+		{&s.release, releaseSQL},
+		{&s.rollbackTo, rollbackToSQL},
+	} {
+		stmt, err := db.Prepare(p.query)
+		if err != nil {
+			s.Close()
+			return nil, err
+		}
+		*p.dst = stmt
+	}
+	return s, nil
+}
+
+// Close closes the prepared statements. Not needed for copies returned by
+// in; those close with their transaction.
+func (s *upsertStmts) Close() {
+	for _, stmt := range []*sql.Stmt{s.selectDocID, s.deleteFTS, s.deleteDoc, s.insertDoc, s.insertFTS, s.savepoint, s.release, s.rollbackTo} {
+		if stmt != nil {
+			stmt.Close()
+		}
+	}
+}
+
+// in returns the statements bound to tx.
+func (s *upsertStmts) in(tx *sql.Tx) *upsertStmts {
+	return &upsertStmts{
+		selectDocID: tx.Stmt(s.selectDocID),
+		deleteFTS:   tx.Stmt(s.deleteFTS),
+		deleteDoc:   tx.Stmt(s.deleteDoc),
+		insertDoc:   tx.Stmt(s.insertDoc),
+		insertFTS:   tx.Stmt(s.insertFTS),
+		savepoint:   tx.Stmt(s.savepoint),
+		release:     tx.Stmt(s.release),
+		rollbackTo:  tx.Stmt(s.rollbackTo),
+	}
+}
+
 // Run executes one source against the given db. It consumes the source's
-// emit channel and upserts each doc.
+// emit channel and upserts each doc in batched transactions. st.Count only
+// includes docs whose batch committed.
 func Run(ctx context.Context, db *sql.DB, src Source, opts EmitOptions) (Stats, error) {
 	var st Stats
+	// cancelled on every return so the emitter stops sending once Run bails
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+	prepared, err := prepareUpsert(db)
+	if err != nil {
+		return st, err
+	}
+	defer prepared.Close()
+
+	tx, err := db.Begin()
+	if err != nil {
+		return st, err
+	}
+	stmts := prepared.in(tx)
+	pending, pendingBytes := 0, 0
+	flush := func() error {
+		if err := tx.Commit(); err != nil {
+			return err
+		}
+		st.Count += pending
+		pending, pendingBytes = 0, 0
+		if tx, err = db.Begin(); err != nil {
+			return err
+		}
+		stmts = prepared.in(tx)
+		return nil
+	}
+	tick := time.NewTicker(upsertFlushEvery)
+	defer tick.Stop()
 	docCh, errCh := src.Emit(ctx, opts)
+	// an early return leaves the emitter mid-send (not every send watches
+	// ctx), so drain whatever is still open until it closes
+	defer func() { go drain(docCh, errCh) }()
 	for docCh != nil || errCh != nil {
 		select {
 		case d, ok := <-docCh:
@@ -75,10 +202,22 @@ func Run(ctx context.Context, db *sql.DB, src Source, opts EmitOptions) (Stats,
 				docCh = nil
 				continue
 			}
-			if err := Upsert(db, d); err != nil {
+			if err := stmts.upsert(d); err != nil {
 				st.Errs++
-			} else {
-				st.Count++
+				continue
+			}
+			pending++
+			pendingBytes += len(d.Content)
+			if pending >= upsertBatch || pendingBytes >= upsertBatchBytes {
+				if err := flush(); err != nil {
+					return st, err
+				}
+			}
+		case <-tick.C:
+			if pending > 0 {
+				if err := flush(); err != nil {
+					return st, err
+				}
 			}
 		case e, ok := <-errCh:
 			if !ok {
@@ -89,41 +228,74 @@ func Run(ctx context.Context, db *sql.DB, src Source, opts EmitOptions) (Stats,
 				st.Errs++
 			}
 		case <-ctx.Done():
+			// the open batch is rolled back, so its docs are not counted
+			tx.Rollback()
 			return st, ctx.Err()
 		}
 	}
+	if err := tx.Commit(); err != nil {
+		return st, err
+	}
+	st.Count += pending
 	return st, nil
 }
 
-// Upsert inserts or replaces a doc + its FTS row. Builtins and external
-// sources share this code path.
-func Upsert(db *sql.DB, d Doc) error {
+// drain discards from docCh and errCh until both are closed. nil channels
+// count as closed.
+func drain(docCh <-chan Doc, errCh <-chan error) {
+	for docCh != nil || errCh != nil {
+		select {
+		case _, ok := <-docCh:
+			if !ok {
+				docCh = nil
+			}
+		case _, ok := <-errCh:
+			if !ok {
+				errCh = nil
+			}
+		}
+	}
+}
+
+// upsert inserts or replaces a doc + its FTS row. Builtins and external
+// sources share this code path. The doc's writes either all land or, on
+// error, are rolled back to leave the existing row in place.
+func (s *upsertStmts) upsert(d Doc) error {
 	if d.Filepath == "" || d.Project == "" || d.SourceType == "" || d.Timestamp == "" {
 		return fmt.Errorf("doc missing required fields")
 	}
+	if _, err := s.savepoint.Exec(); err != nil {
+		return err
+	}
+	if err := s.write(d); err != nil {
+		s.rollbackTo.Exec()
+		s.release.Exec()
+		return err
+	}
+	_, err := s.release.Exec()
+	return err
+}
+
+func (s *upsertStmts) write(d Doc) error {
 	canonical := canonicalProject(d.Project)
 	isLatest := 0
 	if d.IsLatest {
 		isLatest = 1
 	}
 	var oldID int64
-	if err := db.QueryRow("SELECT id FROM documents WHERE filepath = ?", d.Filepath).Scan(&oldID); err == nil {
-		if _, err := db.Exec("DELETE FROM documents_fts WHERE rowid = ?", oldID); err != nil {
+	if err := s.selectDocID.QueryRow(d.Filepath).Scan(&oldID); err == nil {
+		if _, err := s.deleteFTS.Exec(oldID); err != nil {
 			return err
 		}
-		if _, err := db.Exec("DELETE FROM documents WHERE id = ?", oldID); err != nil {
+		if _, err := s.deleteDoc.Exec(oldID); err != nil {
 			return err
 		}
 	}
-	res, err := db.Exec(
-		`INSERT INTO documents
-            (project, timestamp, source_type, dir_type, filepath, filename,
-             is_latest, session_id, topic, indexed_at, cwd, canonical_project)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), ?, ?)`,
+	res, err := s.insertDoc.Exec(
 		d.Project, d.Timestamp, d.SourceType, nilIfEmpty(d.DirType),
 		d.Filepath, filepath.Base(d.Filepath), isLatest,
 		nilIfEmpty(d.SessionID), nilIfEmpty(d.Topic),
-		nilIfEmpty(d.Cwd), canonical,
+		nilIfEmpty(d.Cwd), canonical, nilIfZero(d.MtimeNs),
 	)
 	if err != nil {
 		return err
@@ -136,7 +308,7 @@ func Upsert(db *sql.DB, d Doc) error {
 	if content == "" {
 		content = filepath.Base(d.Filepath)
 	}
-	if _, err := db.Exec("INSERT INTO documents_fts (rowid, content) VALUES (?, ?)", id, content); err != nil {
+	if _, err := s.insertFTS.Exec(id, content); err != nil {
 		return err
 	}
 	return nil
@@ -149,6 +321,13 @@ func nilIfEmpty(s string) any {
 	return s
 }
 
+func nilIfZero(n int64) any {
+	if n == 0 {
+		return nil
+	}
+	return n
+}
+
 func canonicalProject(name string) string {
 	base := archiveBase()
 	return project.Canonicalize(name, base)
@@ -23,6 +23,7 @@ type Doc struct {
 	Topic      string            `json:"topic,omitempty"`
 	IsLatest   bool              `json:"is_latest,omitempty"`
 	Cwd        string            `json:"cwd,omitempty"`
+	MtimeNs    int64             `json:"mtime_ns,omitempty"` // source file mtime; lets incremental sources skip unchanged files
 	Content    string            `json:"content"`
 	Metadata   map[string]string `json:"metadata,omitempty"`
 }
@@ -3,6 +3,7 @@ package sources
 import (
 	"os"
 	"path/filepath"
+	"runtime"
 )
 
 func readFile(p string) string {
@@ -13,6 +14,12 @@ func readFile(p string) string {
 	return filepath.Base(p) + "\n" + string(raw)
 }
 
+// readWorkers is the number of goroutines a source uses for file reads.
+// reads mostly wait on disk, so go wider than the core count.
+func readWorkers() int {
+	return runtime.NumCPU() * 2
+}
+
 func archiveBase() string {
 	if v := os.Getenv("GIANTMEM_ARCHIVE_BASE"); v != "" {
 		return v
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for workspace-migrate-features.py plan scanning.
+
+Run: python3 -m unittest discover -s workspace/tests
+"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "workspace-migrate-features.py"
+
+# hyphenated filename, so load it by path
+_spec = importlib.util.spec_from_file_location("migrate_features", SCRIPT)
+migrate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migrate)
+
+
+class ScanPlanTest(unittest.TestCase):
+    def test_second_pytest_on_a_line_is_not_a_new_command(self):
+        content = (
+            b"run pytest tests/a.py --cov=pytest_plugins\n"
+            b"pytest tests/b.py\n"
+            b"pytest tests/c.py\n"
+        )
+        _, _, tests = migrate.scan_plan(content)
+        self.assertEqual(tests, [
+            "pytest tests/a.py --cov=pytest_plugins",
+            "pytest tests/b.py",
+            "pytest tests/c.py",
+        ])
+
+    def test_docker_compose_command_is_kept_whole(self):
+        _, _, tests = migrate.scan_plan(b"docker compose run web pytest x\n")
+        self.assertEqual(tests, ["docker compose run web pytest x"])
+
+    def test_keys_inside_test_commands_are_still_found(self):
+        _, keys, tests = migrate.scan_plan(b"pytest tests/ -e REDIS_HOST_URL=x\n")
+        self.assertEqual(keys, ["REDIS_HOST_URL"])
+        self.assertEqual(tests, ["pytest tests/ -e REDIS_HOST_URL=x"])
+
+    def test_flags_do_not_overlap(self):
+        flags, _, _ = migrate.scan_plan(b"set enable_foo_enable_bar and enable_baz\n")
+        self.assertEqual(flags, ["enable_foo_enable_bar", "enable_baz"])
+
+
+if __name__ == "__main__":
+    unittest.main()
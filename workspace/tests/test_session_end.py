@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for workspace_session_end.py transcript parsing and the sessions.jsonl
+sidecar.
+
+Run: python3 -m unittest discover -s workspace/tests
+"""
+
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "workspace_session_end.py"
+
+_spec = importlib.util.spec_from_file_location("session_end", SCRIPT)
+session_end = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(session_end)
+
+
+def user(text, ts=None):
+    msg = {"type": "user", "message": {"content": text}}
+    if ts:
+        msg["timestamp"] = ts
+    return msg
+
+
+def assistant(*blocks, ts=None):
+    msg = {"type": "assistant", "message": {"content": list(blocks)}}
+    if ts:
+        msg["timestamp"] = ts
+    return msg
+
+
+def text(t):
+    return {"type": "text", "text": t}
+
+
+def tool(name, **inp):
+    return {"type": "tool_use", "name": name, "input": inp}
+
+
+class ParseTranscriptTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, *lines):
+        """Write lines (dicts as json, anything else verbatim) to a transcript."""
+        path = os.path.join(self.tmp.name, "t.jsonl")
+        with open(path, "w") as f:
+            for line in lines:
+                f.write((json.dumps(line) if isinstance(line, dict) else line) + "\n")
+        return path
+
+    def test_missing_file_is_none(self):
+        self.assertIsNone(session_end.parse_transcript(os.path.join(self.tmp.name, "nope.jsonl")))
+
+    def test_non_object_and_bad_lines_are_skipped(self):
+        path = self.write(
+            "[1, 2]",
+            '"just a string"',
+            "42",
+            "not json",
+            "",
+            user("fix the login redirect", ts="2025-03-04T10:00:00.000Z"),
+            assistant(text("looking at it"), ts="2025-03-04T10:05:00.000Z"),
+        )
+        t = session_end.parse_transcript(path)
+        self.assertIsNotNone(t)
+        self.assertEqual(t.user_prompts, ["fix the login redirect"])
+        self.assertTrue(t.has_assistant_text)
+        self.assertEqual(t.start_time, datetime(2025, 3, 4, 10, 0, tzinfo=timezone.utc))
+        self.assertEqual(t.end_time, datetime(2025, 3, 4, 10, 5, tzinfo=timezone.utc))
+
+    def test_only_non_objects_is_none(self):
+        self.assertIsNone(session_end.parse_transcript(self.write("[1]", "null")))
+
+    def test_duplicate_discoveries_keep_first(self):
+        finding = "I discovered that the cache layer skips invalidation on logout."
+        path = self.write(
+            assistant(text(finding)),
+            assistant(text(finding)),
+            assistant(text("Note that the retry loop never backs off between attempts.")),
+        )
+        t = session_end.parse_transcript(path)
+        self.assertEqual(t.discoveries, [
+            ("finding", "discovered that the cache layer skips invalidation on logout"),
+            ("gotcha", "Note that the retry loop never backs off between attempts"),
+        ])
+
+    def test_discoveries_capped(self):
+        blocks = [text(f"I discovered that module number {i:02d} has no tests at all.") for i in range(30)]
+        t = session_end.parse_transcript(self.write(assistant(*blocks)))
+        self.assertEqual(len(t.discoveries), session_end.MAX_DISCOVERIES)
+
+    def test_todo_repeating_a_step_does_not_use_the_cap(self):
+        # the TODOs arrive first; the same text later shows up as plan steps
+        todos = "".join(f"TODO: {i}. migrate the handler number {i:02d}\n" for i in range(1, 21))
+        steps = "".join(f"{i}. migrate the handler number {i:02d}\n" for i in range(1, 11))
+        path = self.write(
+            assistant(text(todos)),
+            assistant(text(steps)),
+            assistant(text("TODO: write the release notes for this\n")),
+        )
+        t = session_end.parse_transcript(path)
+        self.assertEqual(len(t.plans), session_end.MAX_PLANS)
+        self.assertEqual(t.plans[:10], [f"{i}. migrate the handler number {i:02d}" for i in range(1, 11)])
+        self.assertEqual(t.plans[10], "TODO: 11. migrate the handler number 11")
+        # no plan appears twice, step or TODO
+        bare = [p.removeprefix("TODO: ") for p in t.plans]
+        self.assertEqual(len(bare), len(set(bare)))
+
+    def test_tool_events_grouped_and_deduped(self):
+        path = self.write(
+            assistant(tool("Read", file_path="/r/b.py"), tool("Read", file_path="/r/a.py")),
+            assistant(tool("Read", file_path="/r/b.py"), tool("Bash", command="ls")),
+            assistant(tool("Task")),
+        )
+        t = session_end.parse_transcript(path)
+        self.assertEqual(t.tool_usage, {
+            "Bash": ["ls"],
+            "Read": ["/r/a.py", "/r/b.py"],
+            "Task": [],
+        })
+
+    def test_large_transcript_topic_from_head_discoveries_from_tail(self):
+        head = "I discovered that the database schema migration drops a table."
+        tail = "I discovered that the deploy pipeline pins an old docker image."
+        lines = [assistant(text(head))]
+        lines += [user(f"filler prompt {i}") for i in range(50)]
+        lines.append(assistant(text(tail)))
+        path = self.write(*lines)
+
+        old = session_end.TRANSCRIPT_TAIL_THRESHOLD, session_end.TRANSCRIPT_TAIL_BYTES
+        session_end.TRANSCRIPT_TAIL_THRESHOLD, session_end.TRANSCRIPT_TAIL_BYTES = 1000, 300
+        try:
+            t = session_end.parse_transcript(path)
+        finally:
+            session_end.TRANSCRIPT_TAIL_THRESHOLD, session_end.TRANSCRIPT_TAIL_BYTES = old
+
+        self.assertEqual([f for _, f in t.discoveries], [tail.removeprefix("I ").rstrip(".")])
+        self.assertTrue(t.topic_text.startswith(head))
+        self.assertEqual(len(t.user_prompts), 50)
+
+
+class SessionsJsonlTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        os.makedirs(os.path.join(self.tmp.name, "sessions"))
+        self.path = os.path.join(self.tmp.name, "sessions.jsonl")
+
+    def create(self, session_id):
+        return session_end.create_session_file(
+            self.tmp.name, session_id, None, None, "auth", "a brief",
+            [], {}, [], datetime(2025, 3, 4, 10, 0, 0), "2025-03-04 10:00",
+        )
+
+    def records(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_append(self):
+        name = self.create("abcdef1234567")
+        self.assertEqual(self.records(), [
+            {"file": name, "topic": "auth", "brief": "a brief", "ts": "2025-03-04 10:00"},
+        ])
+
+    def test_trim_keeps_newest_whole_records(self):
+        old = {"file": "old.md", "topic": "t", "brief": "b" * 100, "ts": "x"}
+        with open(self.path, "w") as f:
+            while f.tell() <= session_end.SESSIONS_JSONL_MAX_BYTES:
+                f.write(json.dumps(old) + "\n")
+
+        name = self.create("abcdef1234567")
+
+        self.assertLessEqual(os.path.getsize(self.path), session_end.SESSIONS_JSONL_KEEP_BYTES)
+        records = self.records()  # every line still parses
+        self.assertEqual(records[-1]["file"], name)
+        self.assertTrue(all(r == old for r in records[:-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
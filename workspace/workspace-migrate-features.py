@@ -20,7 +20,9 @@ import os
 import sys
 import re
 import json
+import mmap
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -32,12 +34,11 @@ class FeatureCandidate:
     source_files: list = field(default_factory=list)
     status: str = "complete"
     beta_flag: str = ""
-    config_keys: list = field(default_factory=list)
+    config_keys: set = field(default_factory=set)
     builds_on: str = ""
     purpose: str = ""
     key_files: list = field(default_factory=list)
-    test_commands: list = field(default_factory=list)
-    raw_content: str = ""
+    test_commands: set = field(default_factory=set)
 
 
 def slugify(name: str) -> str:
@@ -49,64 +50,82 @@ def slugify(name: str) -> str:
     return name.strip('-')
 
 
-def extract_beta_flags(content: str) -> list:
-    """Extract beta flag names from content."""
-    patterns = [
-        r'beta[_\s]?flag[s]?[:\s]+[`\'"]?(\w+)[`\'"]?',
-        r'enable_\w+',
-        r'feature[_\s]?flag[s]?[:\s]+[`\'"]?(\w+)[`\'"]?',
-    ]
-    flags = set()
-    for pattern in patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        for match in matches:
-            if isinstance(match, tuple):
-                match = match[0] if match[0] else match[1] if len(match) > 1 else ''
-            if match and match.startswith('enable_'):
-                flags.add(match)
-    return list(flags)
-
-
-def extract_config_keys(content: str) -> list:
-    """Extract config/env keys from content."""
-    patterns = [
-        r'[A-Z][A-Z0-9_]{2,}(?:_[A-Z0-9]+)+',  # UPPER_CASE_KEYS
-    ]
+# one pass per plan file. tests and flags are zero-width lookaheads so config
+# keys inside a pytest line or flag name are still seen, same as scanning
+# each pattern separately. the lookaheads also fire inside an earlier test or
+# flag match (a second 'pytest' on the line), so scan_plan skips those to
+# keep each kind non-overlapping. byte patterns: plan files are scanned in
+# place through mmap and only the captured groups are decoded.
+PLAN_SCAN_RE = re.compile(
+    rb'(?=(?P<test>(?:docker compose run[^\n]+)?pytest[^\n]+))'
+    rb'|(?=(?P<flag>enable_\w+))'
+    rb'|(?P<key>[A-Z][A-Z0-9_]{2,}(?:_[A-Z0-9]+)+)'  # UPPER_CASE_KEYS
+)
+
+# ## Purpose, ## Overview, or first paragraph after title
+PURPOSE_RES = (
+    re.compile(rb'##\s*(?:Purpose|Overview|Summary)\s*\n+([^\n#]+)'),
+    re.compile(rb'#[^\n]+\n+([^\n#]+)'),
+)
+
+CONFIG_KEY_SKIP = ('HTTP_', 'API_', 'GET_', 'POST_', 'TODO', 'NOTE', 'IMPORTANT')
+CONFIG_KEY_HINTS = ('SECRET', 'KEY', 'TOKEN', 'TTL', 'URL', 'HOST', 'PORT', 'DB_', 'REDIS_', 'JWT_')
+
+
+def _text(raw: bytes) -> str:
+    return raw.decode('utf-8', 'replace')
+
+
+@contextmanager
+def open_mapped(path: Path):
+    """Yield a read-only mmap of path (b'' for an empty file)."""
+    with open(path, 'rb') as f:
+        # mmap refuses zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def is_config_key(key: str) -> bool:
+    """Filter out common non-config UPPER_CASE patterns."""
+    if any(skip in key for skip in CONFIG_KEY_SKIP):
+        return False
+    return any(hint in key for hint in CONFIG_KEY_HINTS)
+
+
+def scan_plan(content) -> tuple:
+    """Extract (beta_flags, config_keys, test_commands) from bytes or an mmap."""
+    flags = {}
     keys = set()
-    for pattern in patterns:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            # filter out common non-config patterns
-            if not any(skip in match for skip in ['HTTP_', 'API_', 'GET_', 'POST_', 'TODO', 'NOTE', 'IMPORTANT']):
-                if any(hint in match for hint in ['SECRET', 'KEY', 'TOKEN', 'TTL', 'URL', 'HOST', 'PORT', 'DB_', 'REDIS_', 'JWT_']):
-                    keys.add(match)
-    return list(keys)
-
-
-def extract_test_commands(content: str) -> list:
-    """Extract test commands from content."""
-    patterns = [
-        r'docker compose run[^\n]+pytest[^\n]+',
-        r'pytest[^\n]+',
-    ]
-    commands = []
-    for pattern in patterns:
-        matches = re.findall(pattern, content)
-        commands.extend(matches)
-    return list(set(commands))[:3]  # limit to 3
-
-
-def extract_purpose(content: str, filename: str) -> str:
-    """Extract purpose/description from content."""
-    # look for ## Purpose, ## Overview, or first paragraph after title
-    patterns = [
-        r'##\s*(?:Purpose|Overview|Summary)\s*\n+([^\n#]+)',
-        r'#[^\n]+\n+([^\n#]+)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, content)
+    tests = {}
+    flag_end = test_end = 0
+    for m in PLAN_SCAN_RE.finditer(content):
+        kind = m.lastgroup
+        if kind == 'key':
+            key = _text(m.group('key'))
+            if is_config_key(key):
+                keys.add(key)
+        elif kind == 'flag':
+            if m.start() < flag_end:
+                continue
+            flag_end = m.end('flag')
+            flags[_text(m.group('flag'))] = None
+        else:
+            if m.start() < test_end:
+                continue
+            test_end = m.end('test')
+            tests[_text(m.group('test'))] = None
+    return list(flags), list(keys), list(tests)[:3]  # limit tests to 3
+
+
+def extract_purpose(content, filename: str) -> str:
+    """Extract purpose/description from bytes or an mmap."""
+    for pattern in PURPOSE_RES:
+        match = pattern.search(content)
         if match:
-            purpose = match.group(1).strip()
+            purpose = _text(match.group(1)).strip()
             if len(purpose) > 20 and not purpose.startswith('<!--'):
                 return purpose[:200]
     return f"Migrated from {filename}"
@@ -126,7 +145,6 @@ def analyze_plans_directory(scratch_dir: Path) -> dict:
             continue
 
         filename = plan_file.stem
-        content = plan_file.read_text()
 
         # determine feature name from filename
         # patterns: jwt_session_cookie_plan.md, tranche1_llm_implementation.md
@@ -149,26 +167,16 @@ def analyze_plans_directory(scratch_dir: Path) -> dict:
 
         candidate = feature_groups[feature_slug]
         candidate.source_files.append(plan_file.name)
-        candidate.raw_content += f"\n\n--- {plan_file.name} ---\n{content}"
 
         # extract metadata
-        flags = extract_beta_flags(content)
+        with open_mapped(plan_file) as content:
+            flags, config, tests = scan_plan(content)
+            if not candidate.purpose:
+                candidate.purpose = extract_purpose(content, plan_file.name)
         if flags:
             candidate.beta_flag = flags[0]  # use first found
-
-        config = extract_config_keys(content)
-        candidate.config_keys.extend(config)
-
-        tests = extract_test_commands(content)
-        candidate.test_commands.extend(tests)
-
-        if not candidate.purpose:
-            candidate.purpose = extract_purpose(content, plan_file.name)
-
-    # dedupe
-    for candidate in feature_groups.values():
-        candidate.config_keys = list(set(candidate.config_keys))
-        candidate.test_commands = list(set(candidate.test_commands))[:3]
+        candidate.config_keys.update(config)
+        candidate.test_commands.update(tests)
 
     return feature_groups
 
@@ -186,13 +194,14 @@ def create_feature_folder(scratch_dir: Path, candidate: FeatureCandidate, dry_ru
         return True
 
     feature_dir.mkdir(parents=True, exist_ok=True)
+    today = datetime.now().strftime('%Y-%m-%d')
 
     # create spec.md
     spec_content = f"""# Feature: {candidate.name.replace('-', ' ').title()}
 
 builds_on: {candidate.builds_on or "none"}
 status: {candidate.status}
-created: {datetime.now().strftime('%Y-%m-%d')}
+created: {today}
 migrated_from: {', '.join(candidate.source_files)}
 
 ## Purpose
@@ -215,61 +224,34 @@ migrated_from: {', '.join(candidate.source_files)}
 
 <!-- update based on actual implementation -->
 """
-    (feature_dir / "spec.md").write_text(spec_content)
-
-    # create facts.md
-    facts_content = f"""# {candidate.name} facts
-
-## Identifiers
-
-beta_flag: {candidate.beta_flag}
-config_keys:
-"""
-    for key in candidate.config_keys[:5]:
-        facts_content += f"  - {key}\n"
-    if not candidate.config_keys:
-        facts_content += "  - \n"
-
-    facts_content += """
-## Endpoints
-
-affected:
-  -
-new:
-  -
-
-## Key Files
-
-"""
-    for f in candidate.key_files[:5]:
-        facts_content += f"- {f}\n"
-    if not candidate.key_files:
-        facts_content += "- \n"
-
-    facts_content += """
-## Test Commands
-
-```bash
-"""
-    for cmd in candidate.test_commands:
-        facts_content += f"{cmd}\n"
-    if not candidate.test_commands:
-        facts_content += "# add test commands\n"
-    facts_content += "```\n"
-
-    (feature_dir / "facts.md").write_text(facts_content)
+    (feature_dir / "spec.md").write_bytes(spec_content.encode('utf-8'))
+
+    # create facts.md: collect parts, join once
+    config_lines = [f"  - {key}\n" for key in sorted(candidate.config_keys)[:5]] or ["  - \n"]
+    file_lines = [f"- {f}\n" for f in candidate.key_files[:5]] or ["- \n"]
+    test_lines = [f"{cmd}\n" for cmd in sorted(candidate.test_commands)[:3]] or ["# add test commands\n"]
+    parts = [
+        f"# {candidate.name} facts\n\n## Identifiers\n\nbeta_flag: {candidate.beta_flag}\nconfig_keys:\n",
+        *config_lines,
+        "\n## Endpoints\n\naffected:\n  -\nnew:\n  -\n\n## Key Files\n\n",
+        *file_lines,
+        "\n## Test Commands\n\n```bash\n",
+        *test_lines,
+        "```\n",
+    ]
+    (feature_dir / "facts.md").write_bytes(''.join(parts).encode('utf-8'))
 
-    # create meta.json
+    # create meta.json (indented like feature.py writes it; people read it)
     meta = {
         "name": candidate.name,
         "status": candidate.status,
         "builds_on": [candidate.builds_on] if candidate.builds_on else [],
         "beta_flag": candidate.beta_flag,
-        "created": datetime.now().strftime('%Y-%m-%d'),
+        "created": today,
         "migrated_from": candidate.source_files,
-        "last_session": datetime.now().strftime('%Y-%m-%d')
+        "last_session": today
     }
-    (feature_dir / "meta.json").write_text(json.dumps(meta, indent=2))
+    (feature_dir / "meta.json").write_bytes(json.dumps(meta, indent=2).encode('utf-8'))
 
     print(f"  Created: features/{candidate.name}/")
     return True
@@ -16,6 +16,7 @@ Input (JSON on stdin):
 Output files:
 - .giantmem/history/sessions/{timestamp}_{session_id}.md  (detailed session file)
 - .giantmem/history/sessions.md  (index with one-liners)
+- .giantmem/history/sessions.jsonl  (one json record per session, read by the start hook; trimmed to the newest records)
 - .giantmem/context/discoveries.md  (appended)
 - .giantmem/plans/current.md  (updated if plans found)
 
@@ -24,24 +25,35 @@ NOTE: Uses only Python standard library (no external dependencies)
 
 import sys
 import json
+import heapq
+import fcntl
+import io
 import os
 import re
-from pathlib import Path
-from datetime import datetime
-from typing import List, Tuple, Dict, Set, Optional
-from collections import defaultdict
-
-# discovery categories to look for (non-capturing groups for findall)
+from datetime import datetime, timezone
+from typing import List, Tuple, Dict, Optional
+from itertools import groupby
+from operator import itemgetter
+from dataclasses import dataclass, field
+
+# discovery categories to look for. groups stay non-capturing so lastgroup
+# names the category; bodies stop at the end of the sentence
 DISCOVERY_PATTERNS = [
-    (r'\b(?:discovered|found|learned|realized|noticed)\b.{10,100}', 'finding'),
-    (r'\b(?:pattern|architecture|structure)\b.{10,100}', 'architecture'),
-    (r'\b(?:gotcha|caveat|watch out|careful|note that|important)\b.{10,100}', 'gotcha'),
-    (r'\b(?:convention|standard|style|naming)\b.{10,100}', 'convention'),
-    (r'\b(?:dependency|requires|depends on|imports?)\b.{10,100}', 'dependency'),
-    (r'\b(?:config|configuration|setting|environment)\b.{10,100}', 'config'),
-    (r'\b(?:entry\s*point|main|bootstrap|init)\b.{10,100}', 'entry'),
+    (r'\b(?:discovered|found|learned|realized|noticed)\b[^\n.!?]{10,100}', 'finding'),
+    (r'\b(?:pattern|architecture|structure)\b[^\n.!?]{10,100}', 'architecture'),
+    (r'\b(?:gotcha|caveat|watch out|careful|note that|important)\b[^\n.!?]{10,100}', 'gotcha'),
+    (r'\b(?:convention|standard|style|naming)\b[^\n.!?]{10,100}', 'convention'),
+    (r'\b(?:dependency|requires|depends on|imports?)\b[^\n.!?]{10,100}', 'dependency'),
+    (r'\b(?:config|configuration|setting|environment)\b[^\n.!?]{10,100}', 'config'),
+    (r'\b(?:entry\s*point|main|bootstrap|init)\b[^\n.!?]{10,100}', 'entry'),
 ]
 
+# all categories in one pass; the named group that matched is the category
+_DISCOVERY_RE = re.compile(
+    '|'.join(f'(?P<{category}>{pattern})' for pattern, category in DISCOVERY_PATTERNS),
+    re.IGNORECASE,
+)
+
 # topic extraction keywords (weighted)
 TOPIC_KEYWORDS = {
     'auth': ['auth', 'login', 'jwt', 'token', 'session', 'password', 'credential'],
@@ -58,141 +70,259 @@ TOPIC_KEYWORDS = {
     'deploy': ['deploy', 'ci', 'cd', 'pipeline', 'docker', 'kubernetes'],
 }
 
+# read buffer for transcript files (1 MiB)
+TRANSCRIPT_BUFFER = 1 << 20
 
-def read_transcript(transcript_path: str) -> List[dict]:
-    """Read and parse the JSONL transcript file."""
-    messages = []
+# past this size only the tail's assistant text is kept for discovery/plan
+# extraction; prompts, tools and timestamps still come from the whole file
+TRANSCRIPT_TAIL_THRESHOLD = 10_000_000
+TRANSCRIPT_TAIL_BYTES = 2_000_000
+
+# topics by stable id (TOPIC_KEYWORDS order) so scores can live in a list
+_TOPICS = list(TOPIC_KEYWORDS)
+_KW_TO_TOPIC_ID = {
+    keyword: topic_id
+    for topic_id, topic in enumerate(_TOPICS)
+    for keyword in TOPIC_KEYWORDS[topic]
+}
+
+# assistant text scanned for topic keywords (characters)
+TOPIC_SCAN_LIMIT = 64 * 1024
+
+# longest keywords first so 'environment' wins over 'env', 'fixture' over 'fix'
+_KEYWORD_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(k) for k in sorted(_KW_TO_TOPIC_ID, key=len, reverse=True)) + r')\w*\b',
+    re.IGNORECASE,
+)
+
+# numbered plan steps ("1. ..." / "2) ...", matched per line) and
+# TODO/NEXT/STEP markers
+_LEAD_NUM = re.compile(r'\s*(\d+[\.\)]\s+.+)')
+_TODO_RE = re.compile(r'\b(?:TODO|NEXT|STEP)\s*[:\-]?\s*(.+?)(?=\n|$)', re.IGNORECASE)
+
+
+# caps on what one session contributes
+MAX_DISCOVERIES = 10
+MAX_PLANS = 15
+
+# sessions.jsonl is rewritten down to its newest SESSIONS_JSONL_KEEP_BYTES
+# once it passes SESSIONS_JSONL_MAX_BYTES; the start hook only tail-reads it
+SESSIONS_JSONL_MAX_BYTES = 256 * 1024
+SESSIONS_JSONL_KEEP_BYTES = 64 * 1024
+
+
+@dataclass
+class Transcript:
+    user_prompts: List[str] = field(default_factory=list)
+    has_assistant_text: bool = False
+    topic_text: str = ''  # leading assistant text, up to TOPIC_SCAN_LIMIT
+    tool_usage: Dict[str, List[str]] = field(default_factory=dict)
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    discoveries: List[Tuple[str, str]] = field(default_factory=list)
+    plans: List[str] = field(default_factory=list)
+
+
+def _trunc(text: str, n: int) -> str:
+    """Cut text to n characters, marking the cut with '...'."""
+    return text if len(text) <= n else text[:n] + '...'
+
+
+def _tool_target(tool_name: str, tool_input: dict) -> Optional[str]:
+    """File path (or command/description) a tool use touched."""
+    if tool_name in ('Read', 'Write', 'Edit', 'MultiEdit'):
+        return tool_input.get('file_path')
+    elif tool_name == 'Glob':
+        return tool_input.get('pattern')
+    elif tool_name == 'Grep':
+        return tool_input.get('path') or tool_input.get('pattern')
+    elif tool_name == 'Bash':
+        cmd = tool_input.get('command', '')
+        if cmd:
+            # truncate long commands
+            return _trunc(cmd, 100)
+    elif tool_name == 'Task':
+        desc = tool_input.get('description', '')
+        if desc:
+            return f"[{desc}]"
+    return None
+
+
+def parse_transcript(transcript_path: str) -> Optional[Transcript]:
+    """
+    Parse the JSONL transcript in a single streaming pass.
+    Each line is decoded once and fed to every extractor; assistant text
+    is scanned block by block, so discovery/plan extraction stops once its
+    caps are reached. Returns None if the file is missing or holds no
+    messages.
+    """
     full_path = os.path.expanduser(transcript_path)
 
-    if not os.path.exists(full_path):
-        return messages
+    try:
+        size = os.path.getsize(full_path)
+    except OSError:
+        return None
+
+    # byte offset where assistant text starts being kept
+    text_from = size - TRANSCRIPT_TAIL_BYTES if size > TRANSCRIPT_TAIL_THRESHOLD else 0
+
+    user_prompts: List[str] = []
+    has_assistant_text = False
+    topic_parts: List[str] = []
+    topic_len = 0
+    findings: Dict[str, str] = {}
+    steps: Dict[str, None] = {}
+    todos: Dict[str, None] = {}
+    tool_events: List[Tuple[str, str]] = []
+    start_time = None
+    end_time = None
+    first_utc: Optional[str] = None
+    last_utc: Optional[str] = None
+    seen_message = False
+    offset = 0
 
     try:
-        with open(full_path, 'r') as f:
+        # binary with a large buffer: json.loads takes the raw bytes, so the
+        # text layer's per-line decode is skipped
+        with open(full_path, 'rb', buffering=TRANSCRIPT_BUFFER) as f:
             for line in f:
+                keep_text = offset >= text_from
+                offset += len(line)
                 line = line.strip()
-                if line:
-                    try:
-                        msg = json.loads(line)
-                        messages.append(msg)
-                    except json.JSONDecodeError:
-                        continue
+                if not line:
+                    continue
+                try:
+                    msg = json.loads(line)
+                except ValueError:  # bad json or bad utf-8
+                    continue
+                if not isinstance(msg, dict):  # valid json, but not a message
+                    continue
+                seen_message = True
+
+                msg_type = msg.get('type')
+                if msg_type == 'user':
+                    content = msg.get('message', {}).get('content', '')
+                    if isinstance(content, str) and content.strip():
+                        user_prompts.append(_trunc(content.strip(), 200))
+                    elif isinstance(content, list):
+                        for block in content:
+                            if isinstance(block, dict) and block.get('type') == 'text':
+                                text = block.get('text', '').strip()
+                                if text:
+                                    user_prompts.append(_trunc(text, 200))
+
+                elif msg_type == 'assistant':
+                    for block in msg.get('message', {}).get('content', []):
+                        text = None
+                        if isinstance(block, str):
+                            text = block
+                        elif isinstance(block, dict):
+                            block_type = block.get('type')
+                            if block_type == 'text':
+                                text = block.get('text', '')
+                            elif block_type == 'tool_use':
+                                tool_name = block.get('name', 'unknown')
+                                target = _tool_target(tool_name, block.get('input', {}))
+                                # empty string still counts the tool use
+                                tool_events.append((tool_name, target or ''))
+
+                        if not text:
+                            continue
+                        has_assistant_text = True
+                        # the topic comes from the start of the session, even
+                        # when only the tail is kept for discoveries/plans
+                        if topic_len < TOPIC_SCAN_LIMIT:
+                            topic_parts.append(text)
+                            topic_len += len(text) + 1
+                        if not keep_text:
+                            continue
+                        if len(findings) < MAX_DISCOVERIES:
+                            extract_discoveries(text, findings)
+                        if len(steps) < MAX_PLANS:
+                            extract_plans(text, steps, todos)
+
+                ts = msg.get('timestamp')
+                if not ts:
+                    continue
+                # transcript timestamps are fixed-width utc ('...T10:00:00.123Z'),
+                # which order as strings; only the extremes get parsed below
+                if isinstance(ts, str) and ts.endswith('Z'):
+                    if first_utc is None or ts < first_utc:
+                        first_utc = ts
+                    if last_utc is None or ts > last_utc:
+                        last_utc = ts
+                    continue
+                try:
+                    dt = datetime.fromisoformat(ts)
+                    if start_time is None or dt < start_time:
+                        start_time = dt
+                    if end_time is None or dt > end_time:
+                        end_time = dt
+                except (ValueError, TypeError):
+                    pass
     except Exception:
         pass
 
-    return messages
-
-
-def extract_user_prompts(messages: List[dict]) -> List[str]:
-    """Extract user prompts from transcript."""
-    prompts = []
-    for msg in messages:
-        if msg.get('type') == 'user':
-            message = msg.get('message', {})
-            content = message.get('content', '')
-            if isinstance(content, str) and content.strip():
-                # truncate long prompts
-                text = content.strip()
-                if len(text) > 200:
-                    text = text[:200] + '...'
-                prompts.append(text)
-            elif isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict) and block.get('type') == 'text':
-                        text = block.get('text', '').strip()
-                        if text:
-                            if len(text) > 200:
-                                text = text[:200] + '...'
-                            prompts.append(text)
-    return prompts
-
-
-def extract_assistant_content(messages: List[dict]) -> str:
-    """Extract text content from assistant messages."""
-    content_parts = []
-
-    for msg in messages:
-        if msg.get('type') == 'assistant':
-            message = msg.get('message', {})
-            content = message.get('content', [])
-
-            for block in content:
-                if isinstance(block, dict) and block.get('type') == 'text':
-                    content_parts.append(block.get('text', ''))
-                elif isinstance(block, str):
-                    content_parts.append(block)
-
-    return '\n'.join(content_parts)
-
-
-def extract_tool_usage(messages: List[dict]) -> Dict[str, List[str]]:
-    """
-    Extract tool usage with file paths from transcript.
-    Returns dict: tool_name -> list of file paths touched.
-    """
-    tool_files: Dict[str, Set[str]] = defaultdict(set)
-
-    for msg in messages:
-        if msg.get('type') == 'assistant':
-            message = msg.get('message', {})
-            content = message.get('content', [])
-
-            for block in content:
-                if isinstance(block, dict) and block.get('type') == 'tool_use':
-                    tool_name = block.get('name', 'unknown')
-                    tool_input = block.get('input', {})
-
-                    # extract file paths based on tool type
-                    file_path = None
-                    if tool_name in ('Read', 'Write', 'Edit', 'MultiEdit'):
-                        file_path = tool_input.get('file_path')
-                    elif tool_name == 'Glob':
-                        file_path = tool_input.get('pattern')
-                    elif tool_name == 'Grep':
-                        file_path = tool_input.get('path') or tool_input.get('pattern')
-                    elif tool_name == 'Bash':
-                        cmd = tool_input.get('command', '')
-                        if cmd:
-                            # truncate long commands
-                            file_path = cmd[:100] + ('...' if len(cmd) > 100 else '')
-                    elif tool_name == 'Task':
-                        desc = tool_input.get('description', '')
-                        if desc:
-                            file_path = f"[{desc}]"
-
-                    if file_path:
-                        tool_files[tool_name].add(file_path)
-                    else:
-                        # still count the tool use
-                        tool_files[tool_name].add('')
-
-    # convert sets to sorted lists, filter empty strings
-    return {
-        tool: sorted([f for f in files if f])
-        for tool, files in tool_files.items()
+    if not seen_message:
+        return None
+
+    for ts in (first_utc, last_utc):
+        if ts is None:
+            continue
+        try:
+            dt = datetime.fromisoformat(ts[:-1]).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+        if start_time is None or dt < start_time:
+            start_time = dt
+        if end_time is None or dt > end_time:
+            end_time = dt
+
+    # one sort orders tools and their paths; fromkeys then dedupes in order
+    tool_events.sort()
+    tool_usage = {
+        tool: list(dict.fromkeys(path for _, path in group if path))
+        for tool, group in groupby(tool_events, key=itemgetter(0))
     }
 
+    # numbered steps come first; extract_plans keeps todos disjoint from them
+    plans = list(steps) + [f"TODO: {todo}" for todo in todos]
+
+    return Transcript(
+        user_prompts=user_prompts,
+        has_assistant_text=has_assistant_text,
+        topic_text='\n'.join(topic_parts)[:TOPIC_SCAN_LIMIT],
+        tool_usage=tool_usage,
+        start_time=start_time,
+        end_time=end_time,
+        discoveries=[(category, _trunc(finding, 200)) for finding, category in findings.items()],
+        plans=plans[:MAX_PLANS],
+    )
+
 
 def extract_session_topic(user_prompts: List[str], assistant_content: str) -> str:
     """
     Extract a topic/theme from the session by analyzing content.
     Returns a short topic tag like 'auth', 'api', 'refactor'.
     """
-    # combine all text for analysis
-    all_text = ' '.join(user_prompts).lower() + ' ' + assistant_content.lower()
-
-    # count keyword matches per topic
-    topic_scores: Dict[str, int] = defaultdict(int)
-    for topic, keywords in TOPIC_KEYWORDS.items():
-        for keyword in keywords:
-            count = len(re.findall(r'\b' + keyword + r'\w*\b', all_text))
-            topic_scores[topic] += count
-
-    # get top topic
-    if topic_scores:
-        top_topic = max(topic_scores.items(), key=lambda x: x[1])
-        if top_topic[1] > 2:  # minimum threshold
-            return top_topic[0]
+    # keyword matching is case-insensitive, so no lowercased copies are made.
+    # prompts are already truncated; assistant text is capped because the
+    # leading part of a session is enough to settle the topic
+    prompt_text = ' '.join(user_prompts)
+
+    # count keyword matches per topic id
+    scores = [0] * len(_TOPICS)
+    for text, end in ((prompt_text, len(prompt_text)), (assistant_content, TOPIC_SCAN_LIMIT)):
+        for m in _KEYWORD_RE.finditer(text, 0, end):
+            # unicode case folding can match text whose lower() is no keyword
+            topic_id = _KW_TO_TOPIC_ID.get(m.group(1).lower())
+            if topic_id is not None:
+                scores[topic_id] += 1
+
+    # get top topic; max() keeps the first on ties, i.e. TOPIC_KEYWORDS order
+    top_id = max(range(len(scores)), key=scores.__getitem__)
+    if scores[top_id] > 2:  # minimum threshold
+        return _TOPICS[top_id]
 
     return 'general'
 
@@ -215,85 +345,62 @@ def extract_session_brief(user_prompts: List[str], topic: str) -> str:
     if '?' in brief:
         brief = brief.split('?')[0] + '?'
 
-    # truncate
+    # truncate to 80 columns, '...' included
     if len(brief) > 80:
         brief = brief[:77] + '...'
 
     return brief
 
 
-def extract_timestamps(messages: List[dict]) -> Tuple[Optional[datetime], Optional[datetime]]:
-    """Extract session start and end timestamps from messages."""
-    start_time = None
-    end_time = None
-
-    for msg in messages:
-        ts = msg.get('timestamp')
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                if start_time is None or dt < start_time:
-                    start_time = dt
-                if end_time is None or dt > end_time:
-                    end_time = dt
-            except (ValueError, AttributeError):
-                pass
-
-    return start_time, end_time
-
-
-def extract_discoveries(content: str) -> List[Tuple[str, str]]:
-    """Extract potential discoveries from assistant content."""
-    discoveries = []
-    seen = set()
-
-    for pattern, category in DISCOVERY_PATTERNS:
-        matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-        for match in matches:
-            if isinstance(match, tuple):
-                match = ' '.join(match)
-
-            finding = match.strip()
-            if len(finding) < 20 or finding in seen:
-                continue
-
-            if len(finding) > 200:
-                finding = finding[:200] + '...'
-
-            seen.add(finding)
-            discoveries.append((category, finding))
-
-    return discoveries[:10]
-
-
-def extract_plans(content: str) -> List[str]:
-    """Extract implementation plans/steps from content."""
-    plans = []
-    seen = set()
-
-    list_pattern = r'(?:^|\n)\s*(\d+[\.\)]\s+.+?)(?=\n\s*\d+[\.\)]|\n\n|$)'
-    matches = re.findall(list_pattern, content, re.MULTILINE | re.DOTALL)
-
-    for match in matches:
-        step = match.strip()
-        if len(step) > 15 and step not in seen:
-            seen.add(step)
-            plans.append(step)
+def extract_discoveries(text: str, findings: Dict[str, str]) -> None:
+    """
+    Add potential discoveries from one block of assistant text to
+    findings (finding -> category, in order), up to MAX_DISCOVERIES.
+    Keyed on the full text, so a repeat keeps its first category.
+    """
+    for m in _DISCOVERY_RE.finditer(text):
+        # flattened here once so the writers can use findings as-is
+        finding = m.group().replace('\n', ' ').strip()
+        if len(finding) < 20 or finding in findings:
+            continue
 
-    todo_pattern = r'\b(?:TODO|NEXT|STEP)\s*[:\-]?\s*(.+?)(?=\n|$)'
-    matches = re.findall(todo_pattern, content, re.IGNORECASE)
+        findings[finding] = m.lastgroup
+        if len(findings) >= MAX_DISCOVERIES:
+            break
 
-    for match in matches:
-        step = match.strip()
-        if len(step) > 10 and step not in seen:
-            seen.add(step)
-            plans.append(f"TODO: {step}")
 
-    return plans[:15]
+def extract_plans(text: str, steps: Dict[str, None], todos: Dict[str, None]) -> None:
+    """
+    Add numbered plan steps and TODO/NEXT/STEP markers from one block of
+    assistant text to steps and todos (ordered sets), up to MAX_PLANS each.
+    A TODO repeating a step is kept out of todos, so duplicates never use
+    up its cap.
+    """
+    # a step is the rest of its line, so scan line by line rather than
+    # letting a DOTALL pattern backtrack across lines
+    for line in text.split('\n'):
+        m = _LEAD_NUM.match(line)
+        if not m:
+            continue
+        step = m.group(1).strip()
+        if len(step) > 15 and step not in steps:
+            steps[step] = None
+            todos.pop(step, None)
+            if len(steps) >= MAX_PLANS:
+                return
+
+    if len(todos) >= MAX_PLANS:
+        return
+    for match in _TODO_RE.finditer(text):
+        step = match.group(1).strip()
+        if len(step) > 10 and step not in todos and step not in steps:
+            todos[step] = None
+            if len(todos) >= MAX_PLANS:
+                return
 
 
 def create_session_file(
-    workspace_dir: Path,
+    history_dir: str,
     session_id: str,
     start_time: Optional[datetime],
     end_time: Optional[datetime],
@@ -302,119 +409,144 @@ def create_session_file(
     user_prompts: List[str],
     tool_usage: Dict[str, List[str]],
     discoveries: List[Tuple[str, str]],
-) -> Optional[Path]:
-    """Create individual session summary file."""
-    sessions_dir = workspace_dir / "history" / "sessions"
-    sessions_dir.mkdir(parents=True, exist_ok=True)
+    now: datetime,
+    timestamp: str,
+) -> Optional[str]:
+    """Create individual session summary file; returns its filename."""
+    sessions_dir = os.path.join(history_dir, "sessions")
+    os.makedirs(sessions_dir, exist_ok=True)
 
     # filename: YYYYMMDD_HHMMSS_sessionid.md
-    now = datetime.now()
     timestamp_str = now.strftime('%Y%m%d_%H%M%S')
     session_short = session_id[:8] if session_id else 'unknown'
     filename = f"{timestamp_str}_{session_short}.md"
-    session_file = sessions_dir / filename
+    session_file = os.path.join(sessions_dir, filename)
 
     # format times
-    start_str = start_time.strftime('%Y-%m-%d %H:%M') if start_time else now.strftime('%Y-%m-%d %H:%M')
-    end_str = end_time.strftime('%H:%M') if end_time else now.strftime('%H:%M')
-
-    # build content
-    lines = [
-        f"# Session: {start_str} - {end_str}",
-        "",
-        "## Summary",
-        f"Topic: {topic}",
-        f"Brief: {brief}",
-        "",
-    ]
+    start_str = start_time.strftime('%Y-%m-%d %H:%M') if start_time else timestamp
+    end_str = end_time.strftime('%H:%M') if end_time else timestamp[11:]
+
+    # build content; every line written below ends in a newline except the last
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Session: {start_str} - {end_str}\n\n"
+      f"## Summary\nTopic: {topic}\nBrief: {brief}\n\n")
 
     # user prompts
     if user_prompts:
-        lines.append("## User Prompts")
+        w("## User Prompts\n")
         for prompt in user_prompts[:10]:  # limit to 10
             # escape for markdown
             prompt_clean = prompt.replace('\n', ' ').strip()
-            lines.append(f"- {prompt_clean}")
-        lines.append("")
+            w(f"- {prompt_clean}\n")
+        w("\n")
 
     # files modified (group by action)
     if tool_usage:
-        lines.append("## Files Touched")
+        w("## Files Touched\n")
 
-        # group by modification type
+        # group by modification type. each tool's list is already sorted and
+        # unique, so only the merged edit list needs dedupe before the cut
         modified = tool_usage.get('Edit', []) + tool_usage.get('MultiEdit', [])
         created = tool_usage.get('Write', [])
         read_files = tool_usage.get('Read', [])
 
         if modified:
-            lines.append("### Modified")
-            for f in sorted(set(modified))[:20]:
-                lines.append(f"- {f}")
+            w("### Modified\n")
+            for f in heapq.nsmallest(20, set(modified)):
+                w(f"- {f}\n")
 
         if created:
-            lines.append("### Created")
-            for f in sorted(set(created))[:10]:
-                lines.append(f"- {f}")
+            w("### Created\n")
+            for f in created[:10]:
+                w(f"- {f}\n")
 
         if read_files:
-            lines.append("### Read")
-            for f in sorted(set(read_files))[:15]:
-                lines.append(f"- {f}")
+            w("### Read\n")
+            for f in read_files[:15]:
+                w(f"- {f}\n")
 
-        lines.append("")
+        w("\n")
 
     # tool usage stats
     if tool_usage:
-        lines.append("## Tool Usage")
+        w("## Tool Usage\n")
         for tool, files in sorted(tool_usage.items()):
             count = len(files) if files else 1
-            lines.append(f"- {tool}: {count}")
-        lines.append("")
+            w(f"- {tool}: {count}\n")
+        w("\n")
 
     # bash commands
     bash_cmds = tool_usage.get('Bash', [])
     if bash_cmds:
-        lines.append("## Commands Run")
+        w("## Commands Run\n")
         for cmd in bash_cmds[:10]:
-            lines.append(f"- `{cmd}`")
-        lines.append("")
+            w(f"- `{cmd}`\n")
+        w("\n")
 
     # discoveries
     if discoveries:
-        lines.append("## Discoveries Extracted")
+        w("## Discoveries Extracted\n")
         for category, finding in discoveries:
-            finding_clean = finding.replace('\n', ' ').strip()
-            lines.append(f"- [{category}] {finding_clean}")
-        lines.append("")
+            w(f"- [{category}] {finding}\n")
+        w("\n")
 
     # session metadata
-    lines.extend([
-        "## Metadata",
-        f"- Session ID: {session_id}",
-        f"- Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}",
-    ])
+    w(f"## Metadata\n"
+      f"- Session ID: {session_id}\n"
+      f"- Generated: {timestamp}:{now.second:02d}")
 
     try:
-        session_file.write_text('\n'.join(lines))
-        return session_file
+        with open(session_file, 'w') as f:
+            f.write(buf.getvalue())
     except Exception:
         return None
 
+    # sidecar index so the start hook can tail-read recent sessions as json
+    # instead of opening markdown files
+    record = {"file": filename, "topic": topic, "brief": brief, "ts": timestamp}
+    try:
+        # append and trim under one lock so a concurrent SessionEnd can't
+        # append between the trim's read and rewrite
+        with open(os.path.join(history_dir, "sessions.jsonl"), 'a+b') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.write((json.dumps(record) + '\n').encode())
+            f.flush()
+            if f.tell() > SESSIONS_JSONL_MAX_BYTES:
+                trim_sessions_jsonl(f)
+    except Exception:
+        pass
+
+    return filename
+
+
+def trim_sessions_jsonl(f):
+    """
+    Rewrite sessions.jsonl (open 'a+b', locked by the caller) in place,
+    keeping only its newest whole records. In place rather than tmp +
+    rename, so appenders waiting on the lock still hold the live file.
+    """
+    f.seek(-SESSIONS_JSONL_KEEP_BYTES, os.SEEK_END)
+    tail = f.read()
+    tail = tail[tail.find(b'\n') + 1:]  # partial first line
+    f.truncate(0)
+    f.write(tail)  # append mode: lands at offset 0
+
 
 def update_session_index(
-    workspace_dir: Path,
+    history_dir: str,
     session_id: str,
     topic: str,
     brief: str,
     tool_usage: Dict[str, List[str]],
     discoveries_count: int,
     session_filename: str,
+    timestamp: str,
 ):
     """Add one-liner to sessions.md index."""
-    index_file = workspace_dir / "history" / "sessions.md"
-    index_file.parent.mkdir(parents=True, exist_ok=True)
+    index_file = os.path.join(history_dir, "sessions.md")
+    os.makedirs(history_dir, exist_ok=True)
 
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
     session_short = session_id[:8] if session_id else 'unknown'
 
     # count edits
@@ -430,70 +562,69 @@ def update_session_index(
     summary = ', '.join(parts) if parts else 'read-only'
 
     # truncate brief for index
-    brief_short = brief[:50] + '...' if len(brief) > 50 else brief
+    brief_short = _trunc(brief, 50)
 
     line = f"- {timestamp}: [{topic}] {session_short} - {brief_short} ({summary})"
 
     try:
-        with open(index_file, 'a') as f:
-            f.write(line + '\n')
+        with open(index_file, 'ab') as f:
+            f.write(f"{line}\n".encode())
     except Exception:
         pass
 
 
-def append_discoveries(workspace_dir: Path, discoveries: List[Tuple[str, str]]) -> int:
+def append_discoveries(workspace_dir: str, discoveries: List[Tuple[str, str]], timestamp: str) -> int:
     """Append discoveries to discoveries.md."""
     if not discoveries:
         return 0
 
-    discoveries_file = workspace_dir / "context" / "discoveries.md"
-    discoveries_file.parent.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+    context_dir = os.path.join(workspace_dir, "context")
+    discoveries_file = os.path.join(context_dir, "discoveries.md")
+    os.makedirs(context_dir, exist_ok=True)
 
     lines = []
     for category, finding in discoveries:
-        finding = finding.replace('\n', ' ').strip()
         lines.append(f"- {timestamp}: [{category}] {finding}")
 
     try:
-        with open(discoveries_file, 'a') as f:
-            f.write('\n'.join(lines) + '\n')
+        with open(discoveries_file, 'ab') as f:
+            f.write(('\n'.join(lines) + '\n').encode())
         return len(lines)
     except Exception:
         return 0
 
 
-def save_plans(workspace_dir: Path, plans: List[str]) -> bool:
+def save_plans(workspace_dir: str, plans: List[str], now: datetime, timestamp: str) -> bool:
     """Save plans to plans/current.md."""
     if not plans:
         return False
 
-    plans_file = workspace_dir / "plans" / "current.md"
-    plans_file.parent.mkdir(parents=True, exist_ok=True)
+    plans_dir = os.path.join(workspace_dir, "plans")
+    plans_file = os.path.join(plans_dir, "current.md")
+    os.makedirs(plans_dir, exist_ok=True)
 
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
-
-    content = f"# Current Plan\nUpdated: {timestamp}\n\n"
-    content += "## Steps\n"
+    lines = [f"# Current Plan\nUpdated: {timestamp}\n", "## Steps"]
     for i, plan in enumerate(plans, 1):
         plan = plan.replace('\n', ' ').strip()
         if not plan.startswith(('TODO', 'FIXME', 'NEXT')):
-            content += f"{i}. {plan}\n"
+            lines.append(f"{i}. {plan}")
         else:
-            content += f"- {plan}\n"
+            lines.append(f"- {plan}")
+    content = ('\n'.join(lines) + '\n').encode()
 
     try:
-        if plans_file.exists():
-            mtime = plans_file.stat().st_mtime
-            age_hours = (datetime.now().timestamp() - mtime) / 3600
-            if age_hours < 1:
-                with open(plans_file, 'a') as f:
-                    f.write(f"\n---\n{content}")
-                return True
-
-        with open(plans_file, 'w') as f:
-            f.write(content)
+        # a plan saved within the last hour is appended to, not replaced
+        try:
+            age_hours = (now.timestamp() - os.stat(plans_file).st_mtime) / 3600
+        except FileNotFoundError:
+            age_hours = None
+
+        if age_hours is not None and age_hours < 1:
+            with open(plans_file, 'ab') as f:
+                f.write(b"\n---\n" + content)
+        else:
+            with open(plans_file, 'wb') as f:
+                f.write(content)
         return True
     except Exception:
         return False
@@ -508,40 +639,42 @@ def main():
         cwd = input_data.get("cwd", os.getcwd())
         transcript_path = input_data.get("transcript_path", "")
 
-        workspace_dir = Path(cwd) / ".giantmem"
-        if not workspace_dir.exists():
-            workspace_dir = Path(cwd) / "scratch"
+        # plain path strings: every output path below is joined from these
+        workspace_dir = os.path.join(cwd, ".giantmem")
+        if not os.path.exists(workspace_dir):
+            workspace_dir = os.path.join(cwd, "scratch")
 
-        if not workspace_dir.exists():
+        if not os.path.exists(workspace_dir):
             return
 
         if not transcript_path:
             return
 
-        messages = read_transcript(transcript_path)
-        if not messages:
+        transcript = parse_transcript(transcript_path)
+        if transcript is None:
             return
 
-        # extract all content
-        user_prompts = extract_user_prompts(messages)
-        assistant_content = extract_assistant_content(messages)
-        tool_usage = extract_tool_usage(messages)
-        start_time, end_time = extract_timestamps(messages)
+        user_prompts = transcript.user_prompts
+        tool_usage = transcript.tool_usage
+        start_time, end_time = transcript.start_time, transcript.end_time
+        discoveries, plans = transcript.discoveries, transcript.plans
 
-        if not assistant_content and not user_prompts:
+        if not transcript.has_assistant_text and not user_prompts:
             return
 
         # derive topic and brief
-        topic = extract_session_topic(user_prompts, assistant_content)
+        topic = extract_session_topic(user_prompts, transcript.topic_text)
         brief = extract_session_brief(user_prompts, topic)
 
-        # extract discoveries and plans
-        discoveries = extract_discoveries(assistant_content)
-        plans = extract_plans(assistant_content)
+        # one clock read for every file written below
+        now = datetime.now()
+        timestamp = now.strftime('%Y-%m-%d %H:%M')
+
+        history_dir = os.path.join(workspace_dir, "history")
 
         # create individual session file
-        session_file = create_session_file(
-            workspace_dir=workspace_dir,
+        session_filename = create_session_file(
+            history_dir=history_dir,
             session_id=session_id,
             start_time=start_time,
             end_time=end_time,
@@ -550,28 +683,30 @@ def main():
             user_prompts=user_prompts,
             tool_usage=tool_usage,
             discoveries=discoveries,
+            now=now,
+            timestamp=timestamp,
         )
 
         # update index
-        session_filename = session_file.name if session_file else ''
         update_session_index(
-            workspace_dir=workspace_dir,
+            history_dir=history_dir,
             session_id=session_id,
             topic=topic,
             brief=brief,
             tool_usage=tool_usage,
             discoveries_count=len(discoveries),
-            session_filename=session_filename,
+            session_filename=session_filename or '',
+            timestamp=timestamp,
         )
 
         # persist discoveries and plans (existing behavior)
-        discoveries_count = append_discoveries(workspace_dir, discoveries)
-        has_plans = save_plans(workspace_dir, plans)
+        discoveries_count = append_discoveries(workspace_dir, discoveries, timestamp)
+        has_plans = save_plans(workspace_dir, plans, now, timestamp)
 
         # output summary
         parts = []
-        if session_file:
-            parts.append(f"session:{session_file.name}")
+        if session_filename:
+            parts.append(f"session:{session_filename}")
         if discoveries_count > 0:
             parts.append(f"{discoveries_count} discoveries")
         if has_plans:
@@ -24,6 +24,7 @@ NOTE: Uses only Python standard library (no external dependencies)
 """
 
 import sys
+import heapq
 import json
 import os
 import re
@@ -36,6 +37,14 @@ WORKSPACE_LIB = Path(os.environ.get("GIANT_TOOLING_DIR", Path.home() / "dev/gian
 PRELOAD_PACKS_PATH = Path.home() / ".claude" / "config" / "preload_packs.yaml"
 SCOPES_YAML_PATH = Path(os.environ.get("GIANTMEM_SCOPES_PATH", Path.home() / ".giantmem-global" / "scopes.yaml"))
 
+# how long session start waits on workspace_init before moving on
+BOOTSTRAP_WAIT_SECONDS = 0.5
+
+# bytes read from the top of a session file to find its Topic/Brief header
+SESSION_HEAD_BYTES = 1024
+# bytes read from the end of history/sessions.jsonl for recent sessions
+SESSIONS_JSONL_TAIL_BYTES = 4096
+
 
 def bootstrap_workspace(cwd: str) -> bool:
     """
@@ -54,48 +63,96 @@ def bootstrap_workspace(cwd: str) -> bool:
         return False
 
     try:
-        # Source the lib and call workspace_init
+        # Source the lib and call workspace_init. Detached so a slow init
+        # never holds up session start; the short wait lets the usual
+        # (fast) init finish before the context read below.
         cmd = f'source "{WORKSPACE_LIB}" && workspace_init "{cwd}"'
-        subprocess.run(
+        proc = subprocess.Popen(
             ["bash", "-c", cmd],
             cwd=cwd,
-            capture_output=True,
-            timeout=10
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
+        try:
+            proc.wait(timeout=BOOTSTRAP_WAIT_SECONDS)
+        except subprocess.TimeoutExpired:
+            pass
         return True
     except Exception:
         return False
 
 
+def read_sessions_jsonl(jsonl_path: Path, limit: int) -> list:
+    """
+    Tail-read the sessions.jsonl sidecar written by the session end hook.
+    Returns up to `limit` (filename, topic, brief) tuples, newest first.
+    """
+    try:
+        with open(jsonl_path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - SESSIONS_JSONL_TAIL_BYTES))
+            lines = f.read().split(b'\n')
+    except Exception:
+        return []
+
+    if size > SESSIONS_JSONL_TAIL_BYTES:
+        lines = lines[1:]  # partial first line
+
+    sessions = []
+    for line in reversed(lines):
+        if len(sessions) >= limit:
+            break
+        try:
+            record = json.loads(line)
+            sessions.append((record["file"], record.get("topic") or "general", record.get("brief", "")))
+        except Exception:
+            continue
+    return sessions
+
+
 def read_recent_sessions(workspace_dir: Path, limit: int = 3) -> list:
     """
     Read recent session summaries for context injection.
     Returns list of (filename, topic, brief) tuples.
     """
+    # sidecar first; workspaces from before it existed (or with fewer records
+    # than limit) fall back to the session markdown headers
+    sessions = read_sessions_jsonl(workspace_dir / "history" / "sessions.jsonl", limit)
+    if len(sessions) >= limit:
+        return sessions
+
     sessions_dir = workspace_dir / "history" / "sessions"
     if not sessions_dir.exists():
         return []
 
     sessions = []
     try:
-        # get session files sorted by name (newest first due to timestamp prefix)
-        session_files = sorted(sessions_dir.glob("*.md"), reverse=True)
-
-        for session_file in session_files[:limit]:
+        # newest first by name (timestamp prefix); only the top few are opened
+        with os.scandir(sessions_dir) as it:
+            names = [
+                e.name for e in it
+                if e.name.endswith('.md') and not e.name.startswith('.') and e.is_file()
+            ]
+
+        for name in heapq.nlargest(limit, names):
             try:
-                content = session_file.read_text()
+                # Topic/Brief sit in the header, well inside the first 1 KB
+                with open(os.path.join(sessions_dir, name), 'rb') as f:
+                    head = f.read(SESSION_HEAD_BYTES).decode('utf-8', errors='replace')
                 # extract topic and brief from file
                 topic = "general"
                 brief = ""
 
-                for line in content.split('\n'):
+                for line in head.split('\n'):
                     if line.startswith('Topic:'):
                         topic = line.replace('Topic:', '').strip()
                     elif line.startswith('Brief:'):
                         brief = line.replace('Brief:', '').strip()
                         break
 
-                sessions.append((session_file.name, topic, brief))
+                sessions.append((name, topic, brief))
             except Exception:
                 continue
     except Exception: